@@ -5,20 +5,19 @@ Similar to async_qt_chart_on_widget.py but separated GUI and backend.
 
 import sys
 import os
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional
 import asyncio
-import threading
 
 import logging
+import logging.handlers
 from pathlib import Path
 
-from transitions import Machine
-
 # Add project root to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 os.environ["QT_API"] = "PySide6"
 
 from PySide6 import QtCore, QtWidgets
+from qasync import QEventLoop, asyncSlot, asyncClose
 
 from src.logic.apc_data_recorder import ApcDataRecorder
 
@@ -36,175 +35,146 @@ from src.ui.qt_log_table import (
 from src.services.logging_callback import CallbackLoggingHandler
 
 
-class BackendThread(QtCore.QThread):
+# Map backend states to GUI states
+_BACKEND_TO_GUI: Dict[str, str] = {
+    'uninitialized': 'disconnected',
+    'initialized': 'connected',
+    'recording': 'recording',
+    'stopped': 'connected',
+    'error': 'error'
+}
+
+
+class ApcGuiController(QtCore.QObject):
     """
-    QThread to run backend operations without blocking GUI.
+    Controller that integrates GUI with ApcDataRecorder backend.
+    Handles FSM-like state management for GUI buttons.
     """
 
-    # Add failure signals
-    connect_failed = QtCore.Signal()
-    start_failed = QtCore.Signal()
-    stop_failed = QtCore.Signal()
-    disconnect_failed = QtCore.Signal()
+    # Local FSM transition table: (source, trigger) -> dest
+    # unknown (source, trigger) pairs lead to 'error'
+    TRANSITIONS = {
+        ('disconnected', 'fsm_connect'): 'connected',
+        ('connected', 'fsm_start'): 'recording',
+        ('recording', 'fsm_stop'): 'connected',
+        ('connected', 'fsm_disconnect'): 'disconnected',
+        ('error', 'fsm_reset'): 'disconnected',
+    }
 
-    # Add success signals
-    connect_success = QtCore.Signal()
-    start_success = QtCore.Signal()
-    stop_success = QtCore.Signal()
-    disconnect_success = QtCore.Signal()
+    # Signal for state changes
+    state_changed = QtCore.Signal(str)
 
     def __init__(self, recorder: ApcDataRecorder):
         super().__init__()
         self.recorder = recorder
-        self.loop = None
 
-    @QtCore.Slot()
-    def do_connect(self):
-        if self.loop:
-            asyncio.run_coroutine_threadsafe(self._connect(), self.loop)
+        # Local FSM for GUI state (mirrors backend but simpler)
+        self._state = 'disconnected'
+
+        self.gui_update_callback: Optional[Callable[[], None]] = None
+
+        # Coalescing of backend notifications: only the latest mapped state
+        # of a burst is applied, once per event-loop tick
+        self._last_gui_state: str = self.state
+        self._pending = False
+
+    def set_gui_update_callback(self, callback: Callable[[], None]):
+        self.gui_update_callback = callback
+
+    # FSM
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def _fire(self, trigger: str):
+        self._state = self.TRANSITIONS.get((self._state, trigger), 'error')
+
+    def fsm_connect(self):
+        self._fire('fsm_connect')
 
-    @QtCore.Slot()
-    def do_start(self):
-        if self.loop:
-            asyncio.run_coroutine_threadsafe(self._start(), self.loop)
+    def fsm_start(self):
+        self._fire('fsm_start')
 
-    @QtCore.Slot()
-    def do_stop(self):
-        if self.loop:
-            asyncio.run_coroutine_threadsafe(self._stop(), self.loop)
+    def fsm_stop(self):
+        self._fire('fsm_stop')
 
-    @QtCore.Slot()
-    def do_disconnect(self):
-        if self.loop:
-            asyncio.run_coroutine_threadsafe(self._disconnect(), self.loop)
+    def fsm_disconnect(self):
+        self._fire('fsm_disconnect')
 
-    async def _connect(self):
+    def fsm_error(self):
+        self._state = 'error'
+
+    def fsm_reset(self):
+        self._fire('fsm_reset')
+
+    # GUI actions (coroutines scheduled on the qasync loop)
+    @asyncSlot()
+    async def connect(self):
         try:
             success = await self.recorder.initialize()
             if success:
                 self.recorder.logger.info("Connected successfully")
-                self.connect_success.emit()
             else:
-                self.connect_failed.emit()
+                self.fsm_error()
         except Exception as e:
             self.recorder.logger.error(f"Connect failed: {e}")
-            self.connect_failed.emit()
+            self.fsm_error()
 
-    async def _start(self):
+    @asyncSlot()
+    async def start_recording(self):
         try:
             success = await self.recorder.start_recording()
-            if success:
-                self.start_success.emit()
-            else:
-                self.start_failed.emit()
+            if not success:
+                self.fsm_error()
         except Exception as e:
             self.recorder.logger.error(f"Start failed: {e}")
-            self.start_failed.emit()
+            self.fsm_error()
 
-    async def _stop(self):
+    @asyncSlot()
+    async def stop_recording(self):
         try:
             success = await self.recorder.stop_recording()
-            if success:
-                self.stop_success.emit()
-            else:
-                self.stop_failed.emit()
+            if not success:
+                self.fsm_error()
         except Exception as e:
             self.recorder.logger.error(f"Stop failed: {e}")
-            self.stop_failed.emit()
+            self.fsm_error()
 
-    async def _disconnect(self):
+    @asyncSlot()
+    async def disconnect(self):
         try:
             success = await self.recorder.close_connections()
-            if success:
-                self.disconnect_success.emit()
-            else:
-                self.disconnect_failed.emit()
+            if not success:
+                self.fsm_error()
         except Exception as e:
             self.recorder.logger.error(f"Disconnect failed: {e}")
-            self.disconnect_failed.emit()
-
-    def run(self):
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-        self.loop.run_forever()
-
-
-class ApcGuiController(QtCore.QObject):
-    """
-    Controller that integrates GUI with ApcDataRecorder backend.
-    Handles FSM-like state management for GUI buttons.
-    """
-
-    # Signals to communicate with backend thread
-    connect_requested = QtCore.Signal()
-    start_requested = QtCore.Signal()
-    stop_requested = QtCore.Signal()
-    disconnect_requested = QtCore.Signal()
-
-    # Signal for state changes
-    state_changed = QtCore.Signal(str)
-
-    # Signal for backend state changes (emitted from thread)
-    backend_state_changed = QtCore.Signal(str)
-
-    def __init__(self, recorder: ApcDataRecorder):
-        super().__init__()
-        self.recorder = recorder
-
-        # Connect with queued connection for thread safety
-        self.backend_state_changed.connect(self._handle_backend_state_change, QtCore.Qt.QueuedConnection)
-
-        # Local FSM for GUI state (mirrors backend but simpler)
-        self.machine = Machine(
-            model=self,
-            states=['disconnected', 'connected', 'recording', 'error'],
-            initial='disconnected',
-            transitions=[
-                dict(trigger='fsm_connect', source='disconnected', dest='connected'),
-                dict(trigger='fsm_start', source='connected', dest='recording'),
-                dict(trigger='fsm_stop', source='recording', dest='connected'),
-                dict(trigger='fsm_disconnect', source='connected', dest='disconnected'),
-                dict(trigger='fsm_error', source='*', dest='error'),
-                dict(trigger='fsm_reset', source='error', dest='disconnected'),
-            ],
-            auto_transitions=False
-        )
-
-        self.gui_update_callback: Optional[Callable[[], None]] = None
-
-    def set_gui_update_callback(self, callback: Callable[[], None]):
-        self.gui_update_callback = callback
-
-    # GUI actions that emit signals to backend
-    def connect(self):
-        self.connect_requested.emit()
-
-    def start_recording(self):
-        self.start_requested.emit()
-
-    def stop_recording(self):
-        self.stop_requested.emit()
-
-    def disconnect(self):
-        self.disconnect_requested.emit()
-
-    def _emit_backend_state_change(self, new_state: str):
-        self.backend_state_changed.emit(new_state)
+            self.fsm_error()
 
     @QtCore.Slot(str)
     def _handle_backend_state_change(self, new_state: str):
-        # Map backend states to GUI states
-        state_map = {
-            'uninitialized': 'disconnected',
-            'initialized': 'connected',
-            'recording': 'recording',
-            'stopped': 'connected',
-            'error': 'error'
-        }
-        gui_state = state_map.get(new_state, 'disconnected')
+        # Backend runs on the GUI loop; only marshal if called from elsewhere
+        if QtCore.QThread.currentThread() != self.thread():
+            QtCore.QMetaObject.invokeMethod(
+                self, "_handle_backend_state_change",
+                QtCore.Qt.QueuedConnection, QtCore.Q_ARG(str, new_state)
+            )
+            return
+
+        gui_state = _BACKEND_TO_GUI.get(new_state, 'disconnected')
+        if gui_state == self._last_gui_state and (self._pending or gui_state == self.state):
+            return
+
+        self._last_gui_state = gui_state
+        if not self._pending:
+            self._pending = True
+            QtCore.QTimer.singleShot(0, self._flush_state_change)
+
+    def _flush_state_change(self):
+        self._pending = False
+        gui_state = self._last_gui_state
         if gui_state != self.state:
             # Force transition to match backend
-            self.machine.set_state(gui_state)
+            self._state = gui_state
             self.state_changed.emit(gui_state)
             if self.gui_update_callback:
                 self.gui_update_callback()
@@ -216,35 +186,15 @@ class MainWindow(QtWidgets.QMainWindow, Ui_APCMainWindow):
         super().__init__()
         self.setupUi(self)
 
+        # last state the buttons were rendered for
+        self._last_btn_state: Optional[str] = None
+
         # Backend
         self.recorder = ApcDataRecorder(file_logger=True)
         self.controller = ApcGuiController(self.recorder)
 
         # Call set_state_change_callback after instantiation
-        self.recorder.set_state_change_callback(self.controller._emit_backend_state_change)
-
-        # Backend thread
-        self.backend_thread = BackendThread(self.recorder)
-
-        # Connect controller signals to backend thread slots
-        self.controller.connect_requested.connect(self.backend_thread.do_connect)
-        self.controller.start_requested.connect(self.backend_thread.do_start)
-        self.controller.stop_requested.connect(self.backend_thread.do_stop)
-        self.controller.disconnect_requested.connect(self.backend_thread.do_disconnect)
-
-        # Connect failure signals to controller error trigger
-        self.backend_thread.connect_failed.connect(lambda: self.controller.fsm_error())
-        self.backend_thread.start_failed.connect(lambda: self.controller.fsm_error())
-        self.backend_thread.stop_failed.connect(lambda: self.controller.fsm_error())
-        self.backend_thread.disconnect_failed.connect(lambda: self.controller.fsm_error())
-
-        # Remove success signal connections to avoid double triggering
-        # self.backend_thread.connect_success.connect(lambda: self.controller.fsm_connect())
-        # self.backend_thread.start_success.connect(lambda: self.controller.fsm_start())
-        # self.backend_thread.stop_success.connect(lambda: self.controller.fsm_stop())
-        # self.backend_thread.disconnect_success.connect(lambda: self.controller.fsm_disconnect())
-
-        self.backend_thread.start()  # Start the backend in thread
+        self.recorder.set_state_change_callback(self.controller._handle_backend_state_change)
 
         # Connect state change signal to update buttons
         self.controller.state_changed.connect(self.update_buttons)
@@ -252,7 +202,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_APCMainWindow):
         # Connect controller to GUI updates
         self.controller.set_gui_update_callback(self.update_buttons)
 
-        # Buttons → Controller actions (now sync, since backend is in thread)
+        # Buttons → Controller actions (async slots on the main qasync loop)
         self.connect_btn.clicked.connect(self.controller.connect)
         self.start_btn.clicked.connect(self.controller.start_recording)
         self.stop_btn.clicked.connect(self.controller.stop_recording)
@@ -267,12 +217,11 @@ class MainWindow(QtWidgets.QMainWindow, Ui_APCMainWindow):
         # Move bridge to main thread
         self.bridge.moveToThread(QtCore.QThread.currentThread())
 
-    def closeEvent(self, event):
-        # Stop the backend thread on close
-        if self.backend_thread.isRunning():
-            self.backend_thread.loop.call_soon_threadsafe(self.backend_thread.loop.stop)
-            self.backend_thread.wait()
-            self.backend_thread.loop.close()  # Properly close the loop
+    @asyncClose
+    async def closeEvent(self, event):
+        # Close backend resources on the same loop before the window goes away
+        if self.recorder.is_initialized:
+            await self.recorder.close_connections()
         event.accept()
 
     def setup_logging(self) -> logging.Logger:
@@ -296,25 +245,28 @@ class MainWindow(QtWidgets.QMainWindow, Ui_APCMainWindow):
             level_filter_widget=self.log_level_combobox
         )
 
+        # Always create bridge
+        self.bridge = QtLogTableBridge(self.log_model, proxy=self.log_proxy)
+
         enable_autoscroll(
             tableview=self.log_tableview,
             model=self.log_model,
-            checkbox=self.log_autoscroll_checkbox
+            checkbox=self.log_autoscroll_checkbox,
+            bridge=self.bridge
         )
 
         # Use the recorder's logger as the single logger
         logger = self.recorder.logger
         logger.setLevel(logging.DEBUG)
 
-        # Add stream handler for terminal/console output
-        if not any(isinstance(h, logging.StreamHandler) for h in logger.handlers):
+        # Add stream handler for terminal/console output, unless the recorder
+        # already writes the console through its queue listener
+        if not any(isinstance(h, (logging.StreamHandler, logging.handlers.QueueHandler))
+                   for h in logger.handlers):
             stream_handler = logging.StreamHandler()
             stream_handler.setLevel(logging.DEBUG)
             logger.addHandler(stream_handler)
 
-        # Always create bridge
-        self.bridge = QtLogTableBridge(self.log_model)
-
         # Add GUI handler
         if not any(isinstance(h, CallbackLoggingHandler) for h in logger.handlers):
             handler = CallbackLoggingHandler()
@@ -330,13 +282,17 @@ class MainWindow(QtWidgets.QMainWindow, Ui_APCMainWindow):
                     h.add_record_callback(self.bridge.handle_record)
                     break
 
-        # Also add recorder logs to GUI
-        # self.recorder.add_log_callback(lambda msg: logger.info(msg))  # Removed to avoid duplication
+        # Recorder logs reach the table only through the record callback above;
+        # do not also register recorder.add_log_callback (rows would be duplicated)
 
         return logger
 
     def update_buttons(self, state=None):
         s = state if state else self.controller.state
+        if s == self._last_btn_state:
+            return
+        self._last_btn_state = s
+
         self.connect_btn.setEnabled(s == 'disconnected')
         self.start_btn.setEnabled(s == 'connected')
         self.disconnect_btn.setEnabled(s == 'connected')
@@ -345,6 +301,16 @@ class MainWindow(QtWidgets.QMainWindow, Ui_APCMainWindow):
 
 if __name__ == "__main__":
     app = QtWidgets.QApplication(sys.argv)
+
+    # single asyncio loop driven by Qt
+    loop = QEventLoop(app)
+    asyncio.set_event_loop(loop)
+
+    app_close_event = asyncio.Event()
+    app.aboutToQuit.connect(app_close_event.set)
+
     w = MainWindow()
     w.show()
-    app.exec()
\ No newline at end of file
+
+    with loop:
+        loop.run_until_complete(app_close_event.wait())
\ No newline at end of file
@@ -9,18 +9,27 @@ import asyncio
 
 import threading
 
-from collections import deque
-
 import sys
 import os
 import random
 
+import numpy as np
+
+# Add project root to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 os.environ["QT_API"] = "PyQt6"
 
-from PySide6 import QtCore, QtWidgets
+from PySide6 import QtCore, QtGui, QtWidgets
 from matplotlib.backends.backend_qtagg import FigureCanvas
 from matplotlib.figure import Figure
 
+from patterns.chart_ring import SPSCRing, decimate
+
+
+class DataReadyNotifier(QtCore.QObject):
+    """Qt-side proxy of the data source; emitted from the producer thread."""
+    data_ready = QtCore.Signal()
+
 
 class AsyncDataSource:
     """Async adatforrás, async + külön thread, asyncio.Event stop flag használatával"""
@@ -29,30 +38,49 @@ class AsyncDataSource:
         self.signal_amplitude = signal_amplitude
         self.noise_amplitude = noise_amplitude
         self.period = period
+        self._omega = 2.0 * math.pi / period
         self.phase = phase
-        self.x_data = deque(maxlen=maxlen)
-        self.y_data = deque(maxlen=maxlen)
+        self.maxlen = maxlen
+
+        # lock-free SoA ring, rows x, y1, y2
+        self._ring = SPSCRing(maxlen, 3)
 
+        # created in the GUI thread; emitting from the producer thread is
+        # delivered as a queued call
+        self.notifier = DataReadyNotifier()
+
+        # one Generator per source: faster than the legacy np.random API
+        self._rng = np.random.default_rng()
         self._t0 = None
+        self._t_last = 0.0
         self._thread = None
         self._loop = None
         self._stop_event = None
 
-    async def _generate_one(self):
+    async def _generate_block(self, k=16):
         if self._t0 is None:
             self._t0 = time.monotonic()
+            self._t_last = 0.0
+
         await asyncio.sleep(random.uniform(0.001, 0.2))
-        dt = time.monotonic() - self._t0
-        noise = (random.random() - 0.5) * 2 * self.noise_amplitude
-        v1 = self.signal_amplitude * math.sin(2 * math.pi / self.period * dt + self.phase) + noise
-        v2 = self.signal_amplitude * math.cos(2 * math.pi / self.period * dt + self.phase) + noise
-        v3 = v1+v2
-        self.y_data.append((v1,v2,v3))
-        self.x_data.append(dt)
-        
+
+        # one clock read per block, timestamps spread evenly over the
+        # time elapsed since the previous block
+        t_now = time.monotonic() - self._t0
+        t = self._t_last + np.linspace(0.0, t_now - self._t_last, k, endpoint=False)
+        self._t_last = t_now
+
+        noise = self._rng.uniform(-self.noise_amplitude, self.noise_amplitude, k)
+        arg = self._omega * t + self.phase
+
+        v1 = self.signal_amplitude * np.sin(arg) + noise
+        v2 = self.signal_amplitude * np.cos(arg) + noise
+        self._ring.push(np.vstack((t, v1, v2)))
+
     async def _main_loop(self):
         while not self._stop_event.is_set():
-            await self._generate_one()
+            await self._generate_block()
+            self.notifier.data_ready.emit()
 
     def _thread_func(self):
         """Async loop futtatása külön thread-ben"""
@@ -79,7 +107,9 @@ class AsyncDataSource:
             self._thread.join()
 
     def get_data(self):
-        return list(self.x_data), list(self.y_data)
+        """Return (x, y1, y2, y3) ndarrays in time order, y3 = y1 + y2."""
+        x, y1, y2 = self._ring.snapshot()
+        return x, y1, y2, y1 + y2
 
 
 class MplCanvas(FigureCanvas):
@@ -89,9 +119,35 @@ class MplCanvas(FigureCanvas):
         self.axes = fig.add_subplot(111)
         super().__init__(fig)
 
+        # coalesce resize bursts: only the last size is applied (one Agg
+        # re-render), once the event queue has drained
+        self._resize_args = None
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(0)
+        self._resize_timer.timeout.connect(self._apply_resize)
+
+    def resizeEvent(self, event):
+        if self._resize_args is None:
+            self._resize_args = (QtCore.QSize(event.oldSize()), None)
+        self._resize_args = (self._resize_args[0], QtCore.QSize(event.size()))
+        self._resize_timer.start()
+
+    def _apply_resize(self):
+        old_size, size = self._resize_args
+        self._resize_args = None
+        super().resizeEvent(QtGui.QResizeEvent(size, old_size))
+
 
 class MainWindow(QtWidgets.QMainWindow):
 
+    # relative headroom added around the data when the limits are reset
+    LIMIT_MARGIN = 0.05
+    # x headroom ahead of the newest sample, as a fraction of the visible
+    # window: the window scrolls a whole block per tick, so a few percent
+    # would force a full redraw almost every frame
+    X_HEADROOM = 0.5
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -102,56 +158,99 @@ class MainWindow(QtWidgets.QMainWindow):
         self.source = AsyncDataSource(maxlen=n_data)
         self.source.start()
         
-        
-        self.update_plot()
         self._plot_refs = None
+
+        # blitting: cached axes background, refreshed on every full draw
+        # (including the ones triggered by resizing)
+        self._bg = None
+        self._full_draw_pending = False
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+        self.update_plot()
         
         self.show()
 
-        # Setup a timer to trigger the redraw by calling update_plot.
+        # Redraw only when new data arrived, at most once per 33 ms (~30 fps):
+        # the first data_ready arms a single-shot timer, later ones are coalesced.
         self.timer = QtCore.QTimer()
-        self.timer.setInterval(10)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(33)
         self.timer.timeout.connect(self.update_plot)
-               
-        
-        self.timer.start()
+
+        self.source.notifier.data_ready.connect(self._schedule_update)
+
+    def _schedule_update(self):
+        if not self.timer.isActive():
+            self.timer.start()
 
     def update_plot(self):
 
-        xdata, ydata = self.source.get_data()
-        if not xdata or not ydata:
+        xdata, self.y1, self.y2, self.y3 = self.source.get_data()
+        if xdata.size == 0:
             return
         
         self.xdata = xdata
-        y1, y2, y3 = zip(*ydata)   # tuple-öket kapsz vissza
-        self.y1 = list(y1)
-        self.y2 = list(y2)
-        self.y3 = list(y3)
         
         
         if self._plot_refs is None:
             # First time we have no plot reference, so do a normal plot.
             # .plot returns a list of line <reference>s, as we're
             # only getting one we can take the first element.
-            p1 = self.canvas.axes.plot(self.xdata, self.y1, 'r')[0]
-            p2 = self.canvas.axes.plot(self.xdata, self.y2, 'g')[0]
-            p3 = self.canvas.axes.plot(self.xdata, self.y3, 'b')[0]
+            # animated=True keeps the lines out of the cached background.
+            p1 = self.canvas.axes.plot(self.xdata, self.y1, 'r', animated=True)[0]
+            p2 = self.canvas.axes.plot(self.xdata, self.y2, 'g', animated=True)[0]
+            p3 = self.canvas.axes.plot(self.xdata, self.y3, 'b', animated=True)[0]
             self._plot_refs = [p1,p2,p3] 
         else:
             # We have a reference, we can use it to update the data for that line.
+            n_px = self.canvas.axes.bbox.width
             for data, plotref in zip([self.y1,self.y2,self.y3],self._plot_refs):
-                plotref.set_ydata(data)
-                plotref.set_xdata(self.xdata)
-            
+                plotref.set_data(*decimate(self.xdata, data, n_px))
 
+        # A full draw is already queued; it will render the new data too.
+        if self._full_draw_pending:
+            return
 
-        # Trigger the canvas to update and redraw.
-        self.canvas.axes.relim()
-        self.canvas.axes.autoscale_view()
-        self.canvas.draw()
+        ylo = min(y.min() for y in (self.y1, self.y2, self.y3))
+        yhi = max(y.max() for y in (self.y1, self.y2, self.y3))
+        if self._needs_full_draw(xdata, ylo, yhi):
+            # Limits changed: full redraw, draw_event re-caches the background.
+            self._set_limits(xdata, ylo, yhi)
+            self._full_draw_pending = True
+            self.canvas.draw_idle()
+            return
 
+        # Blit only the lines on top of the cached background.
+        self.canvas.restore_region(self._bg)
+        self._draw_lines()
+        self.canvas.blit(self.canvas.axes.bbox)
+        self.canvas.flush_events()
 
+    def _on_draw(self, event):
+        self._full_draw_pending = False
+        self._bg = self.canvas.copy_from_bbox(self.canvas.axes.bbox)
+        self._draw_lines()
 
+    def _draw_lines(self):
+        if self._plot_refs is None:
+            return
+        for ref in self._plot_refs:
+            self.canvas.axes.draw_artist(ref)
+
+    def _needs_full_draw(self, xdata, ylo, yhi) -> bool:
+        if self._bg is None:
+            return True
+        x0, x1 = self.canvas.axes.get_xlim()
+        y0, y1 = self.canvas.axes.get_ylim()
+        return xdata[0] < x0 or xdata[-1] > x1 or ylo < y0 or yhi > y1
+
+    def _set_limits(self, xdata, ylo, yhi):
+        # explicit limits with headroom instead of relim/autoscale_view:
+        # the next frames fit without another full redraw (hysteresis)
+        xspan = (xdata[-1] - xdata[0]) or 1.0
+        ypad = self.LIMIT_MARGIN * ((yhi - ylo) or 1.0)
+        self.canvas.axes.set_xlim(xdata[0], xdata[-1] + self.X_HEADROOM * xspan)
+        self.canvas.axes.set_ylim(ylo - ypad, yhi + ypad)
 
 
     
@@ -1,5 +1,9 @@
 """
-Full example: Matplotlib + Qt6 + transitions FSM
+Full example: Qt6 + transitions FSM + live charts.
+
+Samples are produced in a child process (ProcessDataSource) into a
+shared-memory SPSC ring and drawn with pyqtgraph; set USE_PROCESS_SOURCE /
+USE_PYQTGRAPH to False for the asyncio-thread source / matplotlib widgets.
 """
 
 import time
@@ -9,14 +13,17 @@ import threading
 import random
 import sys
 import os
-from typing import Callable
-from collections import deque
+import functools
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from typing import Callable, Optional
 
 import logging
 from pathlib import Path
 
 import numpy as np
-from scipy.signal import savgol_filter
+from scipy.signal import savgol_coeffs
+from scipy.ndimage import convolve1d
 
 from transitions import Machine
 
@@ -24,10 +31,12 @@ from transitions import Machine
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 os.environ["QT_API"] = "PySide6"
 
-from PySide6 import QtCore, QtWidgets
+from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtGui import QTextCursor
 
 
+import pyqtgraph as pg
+
 from matplotlib.backends.backend_qtagg import FigureCanvas
 from matplotlib.figure import Figure
 
@@ -47,44 +56,118 @@ from src.ui.qt_log_table import (
 
 from src.services.logging_callback import CallbackLoggingHandler
 
+from patterns.chart_ring import SPSCRing, decimate
+
+# pyqtgraph paints with QPainter directly (no Agg rasterisation);
+# set to False to fall back to the matplotlib widgets
+USE_PYQTGRAPH = True
+
+# generate samples in a separate process (ProcessDataSource) instead of an
+# asyncio thread competing with the GUI for the GIL
+USE_PROCESS_SOURCE = True
+
+pg.setConfigOptions(antialias=False)
+
 # ======================================================================
-# Data source (UNCHANGED)
+# Data sources: SPSC ring, asyncio-thread source, shared-memory process source
 # ======================================================================
 
+class DataReadyNotifier(QtCore.QObject):
+    """Qt-side proxy of the data source; emitted from the producer thread."""
+    data_ready = QtCore.Signal()
+    # emitted once, when `warmup_samples` samples have been produced
+    warmed_up = QtCore.Signal()
+
+
 class AsyncDataSource:
     def __init__(self, signal_amplitude=10, noise_amplitude=5.0,
-                 period=1, phase=0.5, maxlen=100):
+                 period=1, phase=0.5, maxlen=100,
+                 smooth_window=21, smooth_order=3, warmup_samples=30):
         self.signal_amplitude = signal_amplitude
         self.noise_amplitude = noise_amplitude
         self.period = period
+        self._omega = 2.0 * math.pi / period
         self.phase = phase
-        self.x_data = deque(maxlen=maxlen)
-        self.y_data = deque(maxlen=maxlen)
-
+        self.maxlen = maxlen
+
+        # rows: x, y1, y2
+        self._ring = SPSCRing(maxlen, 3)
+        # (head, get_data() result): callers within one tick share it
+        self._data_cache = (-1, None)
+
+        # latest Savitzky-Golay smoothed snapshot, swapped in as one tuple.
+        # (window, order) is fixed, so the FIR coefficients are designed once
+        self.smooth_window = smooth_window
+        self.smooth_order = smooth_order
+        self._sg = savgol_coeffs(smooth_window, smooth_order).astype(np.float64)
+        self._smoothed = (np.empty(0),) * 4
+        self._smoothed_head = 0
+
+        # created in the GUI thread; emitting from the producer thread is
+        # delivered as a queued call
+        self.notifier = DataReadyNotifier()
+        self.warmup_samples = warmup_samples
+        self._warmed_up = False
+
+        # one Generator per source: faster than the legacy np.random API
+        self._rng = np.random.default_rng()
         self._t0 = None
+        self._t_last = 0.0
         self._thread = None
         self._loop = None
         self._stop_event = None
 
-    async def _generate_one(self):
+    async def _generate_block(self, k=16):
         if self._t0 is None:
             self._t0 = time.monotonic()
+            self._t_last = 0.0
 
         await asyncio.sleep(random.uniform(0.001, 0.2))
 
-        dt = time.monotonic() - self._t0
-        noise = (random.random() - 0.5) * 2 * self.noise_amplitude
+        # one clock read per block, timestamps spread evenly over the
+        # time elapsed since the previous block
+        t_now = time.monotonic() - self._t0
+        t = self._t_last + np.linspace(0.0, t_now - self._t_last, k, endpoint=False)
+        self._t_last = t_now
+
+        noise = self._rng.uniform(-self.noise_amplitude, self.noise_amplitude, k)
+        arg = self._omega * t + self.phase
 
-        v1 = self.signal_amplitude * math.sin(2 * math.pi / self.period * dt + self.phase) + noise
-        v2 = self.signal_amplitude * math.cos(2 * math.pi / self.period * dt + self.phase) + noise
-        v3 = v1 + v2
+        v1 = self.signal_amplitude * np.sin(arg) + noise
+        v2 = self.signal_amplitude * np.cos(arg) + noise
+        self._ring.push(np.vstack((t, v1, v2)))
 
-        self.x_data.append(dt)
-        self.y_data.append((v1, v2, v3))
+    def _snapshot(self):
+        data = self._ring.snapshot()
+        return data[0], data[1:]
+
+    async def _smooth(self):
+        head = self.head
+        x, ys = self.get_data_arrays()
+        if x.size < self.smooth_window:
+            return
+
+        # filtering runs in the default executor, not on the asyncio loop
+        loop = asyncio.get_running_loop()
+        ys = await loop.run_in_executor(
+            None,
+            functools.partial(convolve1d, ys, self._sg, axis=1, mode='nearest')
+        )
+        self._smoothed = (x, ys[0], ys[1], ys[2])
+        # published after the data, like the ring head
+        self._smoothed_head = head
 
     async def _main_loop(self):
         while not self._stop_event.is_set():
-            await self._generate_one()
+            await self._generate_block()
+            await self._smooth()
+            self._notify()
+
+    def _notify(self):
+        if not self._warmed_up and self.head >= self.warmup_samples:
+            self._warmed_up = True
+            self.notifier.warmed_up.emit()
+        self.notifier.data_ready.emit()
 
     def _thread_func(self):
         self._loop = asyncio.new_event_loop()
@@ -105,8 +188,157 @@ class AsyncDataSource:
         if self._thread:
             self._thread.join()
 
+    @property
+    def head(self) -> int:
+        """Total number of samples produced so far (monotonic)."""
+        return self._ring.head
+
+    @property
+    def smoothed_head(self) -> int:
+        """`head` at which the current smoothed snapshot was taken."""
+        return self._smoothed_head
+
     def get_data(self):
-        return list(self.x_data), list(self.y_data)
+        """Return (x, y1, y2, y3) ndarrays in time order, y3 = y1 + y2."""
+        head = self.head
+        cached_head, data = self._data_cache
+        if head == cached_head:
+            return data
+
+        x, y = self._snapshot()
+        data = (x, y[0], y[1], y[0] + y[1])
+        self._data_cache = (head, data)
+        return data
+
+    def get_data_arrays(self):
+        """Return (x, ys) in time order, ys of shape (3, n) = (y1, y2, y1 + y2)."""
+        x, y = self._snapshot()
+        ys = np.empty((3, x.size))
+        ys[:2] = y
+        np.add(y[0], y[1], out=ys[2])
+        return x, ys
+
+    def get_smoothed_data(self):
+        """Return the latest smoothed (x, y1, y2, y3) snapshot."""
+        return self._smoothed
+
+
+class SharedMemoryRing(SPSCRing):
+    """
+    SPSCRing in shared memory, for a producer in another process.
+    The head and claim live in multiprocessing.Values (`count`, `claim`).
+    """
+
+    def __init__(self, maxlen, ncols, name=None, count=None, claim=None):
+        self.shm = shared_memory.SharedMemory(
+            name=name, create=name is None, size=maxlen * ncols * 8
+        )
+        self.count = count if count is not None else mp.Value('q', 0, lock=False)
+        self.claim = claim if claim is not None else mp.Value('q', 0, lock=False)
+        super().__init__(maxlen, ncols,
+                         buf=np.ndarray((ncols, maxlen), dtype=np.float64,
+                                        buffer=self.shm.buf))
+
+    def _load_head(self) -> int:
+        return self.count.value
+
+    def _store_head(self, head: int):
+        self.count.value = head
+
+    def _load_claim(self) -> int:
+        return self.claim.value
+
+    def _store_claim(self, claim: int):
+        self.claim.value = claim
+
+    def close(self, unlink=False):
+        del self.buf
+        self.shm.close()
+        if unlink:
+            self.shm.unlink()
+
+
+def _producer_main(shm_name, maxlen, count, claim, stop_flag,
+                   signal_amplitude, noise_amplitude, period, phase,
+                   t_offset=0.0, k=16):
+    """
+    Producer process: same signal model as AsyncDataSource._generate_block.
+    Time continues from `t_offset`, so a restart keeps x monotonic.
+    """
+    ring = SharedMemoryRing(maxlen, 3, name=shm_name, count=count, claim=claim)
+    omega = 2.0 * math.pi / period
+    rng = np.random.default_rng()
+    t0 = time.monotonic() - t_offset
+    t_last = t_offset
+    try:
+        while not stop_flag.value:
+            time.sleep(random.uniform(0.001, 0.2))
+
+            t_now = time.monotonic() - t0
+            t = t_last + np.linspace(0.0, t_now - t_last, k, endpoint=False)
+            t_last = t_now
+
+            noise = rng.uniform(-noise_amplitude, noise_amplitude, k)
+            arg = omega * t + phase
+            ring.push(np.vstack((t,
+                                 signal_amplitude * np.sin(arg) + noise,
+                                 signal_amplitude * np.cos(arg) + noise)))
+    finally:
+        ring.close()
+
+
+class ProcessDataSource(AsyncDataSource):
+    """
+    AsyncDataSource whose samples are generated in a child process and
+    shared through a SharedMemoryRing. The asyncio thread only watches
+    the published count, runs the smoothing and emits `data_ready`.
+    """
+
+    def __init__(self, poll_interval=0.005, **kwargs):
+        super().__init__(**kwargs)
+        self.poll_interval = poll_interval
+        self._ring = SharedMemoryRing(self.maxlen, 3)
+        self._stop_flag = mp.Value('b', 0, lock=False)
+        self._process = None
+
+    async def _main_loop(self):
+        seen = self.head
+        while not self._stop_event.is_set():
+            head = self.head
+            if head == seen:
+                await asyncio.sleep(self.poll_interval)
+                continue
+            seen = head
+            await self._smooth()
+            self._notify()
+
+    def start(self):
+        self._stop_flag.value = 0
+        # continue after the newest sample already in the ring (restart)
+        t_last = self._ring.last(0)
+        self._process = mp.Process(
+            target=_producer_main,
+            args=(self._ring.shm.name, self.maxlen, self._ring.count,
+                  self._ring.claim, self._stop_flag, self.signal_amplitude,
+                  self.noise_amplitude, self.period, self.phase,
+                  t_last if t_last is not None else 0.0),
+            daemon=True
+        )
+        self._process.start()
+        super().start()
+
+    def stop(self):
+        self._stop_flag.value = 1
+        if self._process:
+            self._process.join()
+            self._process = None
+        super().stop()
+
+    def close(self):
+        """Stop the producer and release the shared memory block."""
+        if self._process:
+            self.stop()
+        self._ring.close(unlink=True)
 
 
 # ======================================================================
@@ -114,22 +346,99 @@ class AsyncDataSource:
 # ======================================================================
 
 class MplCanvas(FigureCanvas):
-    def __init__(self, parent=None):
-        fig = Figure(figsize=(5, 4), dpi=100)
-        self.axes = fig.add_subplot(111)
+    def __init__(self, parent=None, nrows=1):
+        fig = Figure(figsize=(5, 4 * nrows), dpi=100)
+        # stacked axes share one Agg buffer and one x axis
+        self.axes_list = list(fig.subplots(nrows, 1, sharex=True, squeeze=False)[:, 0])
+        self.axes = self.axes_list[0]
         super().__init__(fig)
         self.setSizePolicy(QtWidgets.QSizePolicy.Expanding,
                            QtWidgets.QSizePolicy.Expanding)
 
+        # coalesce resize bursts: only the last size is applied (one Agg
+        # re-render), once the event queue has drained
+        self._resize_args = None
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(0)
+        self._resize_timer.timeout.connect(self._apply_resize)
+
+    def resizeEvent(self, event):
+        if self._resize_args is None:
+            self._resize_args = (QtCore.QSize(event.oldSize()), None)
+        self._resize_args = (self._resize_args[0], QtCore.QSize(event.size()))
+        self._resize_timer.start()
+
+    def _apply_resize(self):
+        old_size, size = self._resize_args
+        self._resize_args = None
+        super().resizeEvent(QtGui.QResizeEvent(size, old_size))
+
 
 # ======================================================================
 # Chart widget
 # ======================================================================
 
+class _AxesTrace:
+    """Three animated lines on one Axes, fed by a `get_data_func`."""
+
+    def __init__(self, axes, get_data_func: Callable,
+                 get_head_func: Optional[Callable] = None):
+        self.axes = axes
+        self.get_data_func = get_data_func
+        self.get_head_func = get_head_func
+        self.last_head = -1
+        self.plot_refs = None
+
+    def advanced(self) -> bool:
+        if self.get_head_func is None:
+            return True
+        head = self.get_head_func()
+        if head == self.last_head:
+            return False
+        self.last_head = head
+        return True
+
+    def set_lines(self, xdata, ys):
+        if self.plot_refs is None:
+            self.plot_refs = [self.axes.plot(xdata, y, c, animated=True)[0]
+                              for y, c in zip(ys, ('r', 'g', 'b'))]
+            return
+        n_px = self.axes.bbox.width
+        for data, ref in zip(ys, self.plot_refs):
+            ref.set_data(*decimate(xdata, data, n_px))
+
+    def draw_lines(self):
+        if self.plot_refs is None:
+            return
+        for ref in self.plot_refs:
+            self.axes.draw_artist(ref)
+
+
 class CustomChartWidget(QtWidgets.QWidget, Ui_ChannelViewWidget):
+    """
+    Realtime chart of three lines per axes.
+
+    `get_data_func` must return a tuple `(x, y1, y2, y3)` of equally long
+    1-D ndarrays in time order; an empty `x` means "nothing to draw yet".
+    The optional `get_head_func` returns a monotonic sample counter; when
+    given, ticks where it has not advanced are skipped.
+
+    The first trace goes on `canvas.axes`; further axes of the same canvas
+    are fed with `add_trace`, and all of them share one draw/blit per tick.
+    """
+
+    # relative headroom added around the data when the limits are reset
+    LIMIT_MARGIN = 0.05
+    # x headroom ahead of the newest sample, as a fraction of the visible
+    # window: the window scrolls a whole block per tick, so a few percent
+    # would force a full redraw almost every frame
+    X_HEADROOM = 0.5
+
     def __init__(self, channel_name: str,
                  canvas: FigureCanvas,
                  get_data_func: Callable,
+                 get_head_func: Optional[Callable] = None,
                  parent=None):
         super().__init__(parent)
         self.setupUi(self)
@@ -138,32 +447,124 @@ class CustomChartWidget(QtWidgets.QWidget, Ui_ChannelViewWidget):
         self.realtime_layout.addWidget(self.canvas)
         self.channel_name_label.setText(channel_name)
 
-        self._plot_refs = None
-        self._get_data_func = get_data_func
+        self._traces = [_AxesTrace(canvas.axes, get_data_func, get_head_func)]
+
+        # blitting: cached figure background, refreshed on every full draw
+        # (including the ones triggered by resizing)
+        self._bg = None
+        self._full_draw_pending = False
+        self.canvas.mpl_connect('draw_event', self._on_draw)
 
         self.setSizePolicy(QtWidgets.QSizePolicy.Expanding,
                            QtWidgets.QSizePolicy.Expanding)
 
+    def add_trace(self, axes, get_data_func: Callable,
+                  get_head_func: Optional[Callable] = None):
+        self._traces.append(_AxesTrace(axes, get_data_func, get_head_func))
+
+    def _on_draw(self, event):
+        self._full_draw_pending = False
+        self._bg = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_lines()
+
+    def _draw_lines(self):
+        for trace in self._traces:
+            trace.draw_lines()
+
+    def _needs_full_draw(self, axes, xdata, ylo, yhi) -> bool:
+        if self._bg is None:
+            return True
+        x0, x1 = axes.get_xlim()
+        y0, y1 = axes.get_ylim()
+        return xdata[0] < x0 or xdata[-1] > x1 or ylo < y0 or yhi > y1
+
+    def _set_limits(self, axes, xdata, ylo, yhi):
+        # explicit limits with headroom instead of relim/autoscale_view:
+        # the next frames fit without another full redraw (hysteresis)
+        xspan = (xdata[-1] - xdata[0]) or 1.0
+        ypad = self.LIMIT_MARGIN * ((yhi - ylo) or 1.0)
+        axes.set_xlim(xdata[0], xdata[-1] + self.X_HEADROOM * xspan)
+        axes.set_ylim(ylo - ypad, yhi + ypad)
+
     def update_plot(self):
-        xdata, ydata = self._get_data_func()
-        if not xdata:
+        changed = False
+        full_draw = False
+        for trace in self._traces:
+            if not trace.advanced():
+                continue
+
+            xdata, y1, y2, y3 = trace.get_data_func()
+            if xdata.size == 0:
+                continue
+
+            trace.set_lines(xdata, (y1, y2, y3))
+            changed = True
+
+            # a full draw is already queued and will render the new data too
+            if self._full_draw_pending:
+                continue
+
+            ylo = min(y.min() for y in (y1, y2, y3))
+            yhi = max(y.max() for y in (y1, y2, y3))
+            if self._needs_full_draw(trace.axes, xdata, ylo, yhi):
+                self._set_limits(trace.axes, xdata, ylo, yhi)
+                full_draw = True
+
+        if not changed or self._full_draw_pending:
+            return
+
+        if full_draw:
+            # limits changed: full redraw, draw_event re-caches the background
+            self._full_draw_pending = True
+            self.canvas.draw_idle()
             return
 
-        y1, y2, y3 = zip(*ydata)
+        # one restore + one blit for all axes of the figure
+        self.canvas.restore_region(self._bg)
+        self._draw_lines()
+        self.canvas.blit(self.canvas.figure.bbox)
+        self.canvas.flush_events()
 
-        if self._plot_refs is None:
-            p1 = self.canvas.axes.plot(xdata, y1, 'r')[0]
-            p2 = self.canvas.axes.plot(xdata, y2, 'g')[0]
-            p3 = self.canvas.axes.plot(xdata, y3, 'b')[0]
-            self._plot_refs = [p1, p2, p3]
-        else:
-            for data, ref in zip((y1, y2, y3), self._plot_refs):
-                ref.set_xdata(xdata)
-                ref.set_ydata(data)
 
-        self.canvas.axes.relim()
-        self.canvas.axes.autoscale_view()
-        self.canvas.draw()
+class PgChartWidget(QtWidgets.QWidget, Ui_ChannelViewWidget):
+    """
+    pyqtgraph variant of CustomChartWidget, same `get_data_func` contract.
+    """
+
+    def __init__(self, channel_name: str,
+                 get_data_func: Callable,
+                 get_head_func: Optional[Callable] = None,
+                 parent=None):
+        super().__init__(parent)
+        self.setupUi(self)
+
+        self.plot = pg.PlotWidget()
+        self.plot.setClipToView(True)
+        self.plot.setDownsampling(auto=True, mode='peak')
+        self.realtime_layout.addWidget(self.plot)
+        self.channel_name_label.setText(channel_name)
+
+        self.curves = [self.plot.plot(pen=c) for c in ('r', 'g', 'b')]
+        self._get_data_func = get_data_func
+        self._get_head_func = get_head_func
+        self._last_head = -1
+
+        self.setSizePolicy(QtWidgets.QSizePolicy.Expanding,
+                           QtWidgets.QSizePolicy.Expanding)
+
+    def update_plot(self):
+        if self._get_head_func is not None:
+            head = self._get_head_func()
+            if head == self._last_head:
+                return
+            self._last_head = head
+
+        xdata, y1, y2, y3 = self._get_data_func()
+        if xdata.size == 0:
+            return
+
+        for curve, data in zip(self.curves, (y1, y2, y3)):
+            curve.setData(xdata, data)
 
 
 # ======================================================================
@@ -179,11 +580,11 @@ class MainWindow(QtWidgets.QMainWindow, Ui_APCMainWindow):
         # ------------------------------------------------------------------
         # Data
         # ------------------------------------------------------------------
-        self.source = AsyncDataSource(maxlen=100, period=5)
-        
+        if USE_PROCESS_SOURCE:
+            self.source = ProcessDataSource(maxlen=100, period=5)
+        else:
+            self.source = AsyncDataSource(maxlen=100, period=5)
 
-        # while len(self.source.x_data) < 30:
-        #     time.sleep(0.1)
 
         # ------------------------------------------------------------------
         # Charts
@@ -191,40 +592,57 @@ class MainWindow(QtWidgets.QMainWindow, Ui_APCMainWindow):
         wrapper = QtWidgets.QWidget()
         layout = QtWidgets.QVBoxLayout(wrapper)
 
-        w1 = CustomChartWidget(
-            "Channel 1",
-            MplCanvas(self),
-            get_data_func=self.source.get_data,
-            parent=self
-        )
-
-        def get_data_channel_2():
-            x, y = self.source.get_data()
-            if not y:
-                return x, []
-            y1, y2, y3 = zip(*y)
-            y1 = savgol_filter(y1, 21, 3)
-            y2 = savgol_filter(y2, 21, 3)
-            y3 = savgol_filter(y3, 21, 3)
-            return x, list(zip(y1, y2, y3))
-
-        w2 = CustomChartWidget(
-            "Channel 2",
-            MplCanvas(self),
-            get_data_func=get_data_channel_2,
-            parent=self
-        )
-
-        layout.addWidget(w1)
-        layout.addWidget(w2)
+        if USE_PYQTGRAPH:
+            w1 = PgChartWidget(
+                "Channel 1",
+                get_data_func=self.source.get_data,
+                get_head_func=lambda: self.source.head,
+                parent=self
+            )
+            w2 = PgChartWidget(
+                "Channel 2",
+                get_data_func=self.source.get_smoothed_data,
+                get_head_func=lambda: self.source.smoothed_head,
+                parent=self
+            )
+            self.chart_widgets = (w1, w2)
+        else:
+            # one figure, two stacked axes: a single Agg buffer and one
+            # draw/blit per tick for both channels
+            canvas = MplCanvas(self, nrows=2)
+            w = CustomChartWidget(
+                "Channel 1 / Channel 2",
+                canvas,
+                get_data_func=self.source.get_data,
+                get_head_func=lambda: self.source.head,
+                parent=self
+            )
+            w.add_trace(
+                canvas.axes_list[1],
+                get_data_func=self.source.get_smoothed_data,
+                get_head_func=lambda: self.source.smoothed_head
+            )
+            self.chart_widgets = (w,)
+
+        for w in self.chart_widgets:
+            layout.addWidget(w)
         self.view_layout.addWidget(wrapper)
 
         # ------------------------------------------------------------------
         # Timer
         # ------------------------------------------------------------------
+        # Redraw only when new data arrived, at most once per 33 ms (~30 fps):
+        # the first data_ready arms a single-shot timer, later ones are coalesced.
         self.timer = QtCore.QTimer()
-        self.timer.setInterval(100)
-        self.timer.timeout.connect(lambda: (w1.update_plot(), w2.update_plot()))
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(33)
+        self.timer.timeout.connect(self.update_charts)
+
+        # charts stay idle until the source has produced enough samples;
+        # signalled from the producer thread, never waited for here
+        self._warmed_up = False
+        self.source.notifier.warmed_up.connect(self._on_warmed_up)
+        self.source.notifier.data_ready.connect(self._schedule_update)
 
         # ------------------------------------------------------------------
         # FSM
@@ -289,10 +707,13 @@ class MainWindow(QtWidgets.QMainWindow, Ui_APCMainWindow):
         # ==================================================
         # AUTOSCROLL
         # ==================================================
+        self.bridge = QtLogTableBridge(self.log_model, proxy=self.log_proxy)
+
         enable_autoscroll(
             tableview=self.log_tableview,
             model=self.log_model,
-            checkbox=self.log_autoscroll_checkbox
+            checkbox=self.log_autoscroll_checkbox,
+            bridge=self.bridge
         )
 
         # ==================================================
@@ -305,8 +726,7 @@ class MainWindow(QtWidgets.QMainWindow, Ui_APCMainWindow):
             handler = CallbackLoggingHandler()
             handler.setLevel(logging.DEBUG)
 
-            bridge = QtLogTableBridge(self.log_model)
-            handler.add_record_callback(bridge.handle_record)
+            handler.add_record_callback(self.bridge.handle_record)
 
             logger.addHandler(handler)
 
@@ -323,7 +743,6 @@ class MainWindow(QtWidgets.QMainWindow, Ui_APCMainWindow):
 
     def on_start(self):
         self.logger.info("FSM: start")
-        self.timer.start()
         self.source.start()
         self.update_buttons()
 
@@ -338,6 +757,30 @@ class MainWindow(QtWidgets.QMainWindow, Ui_APCMainWindow):
         self.timer.stop()
         self.update_buttons()
 
+    def _on_warmed_up(self):
+        self._warmed_up = True
+        self._schedule_update()
+
+    def _schedule_update(self):
+        if (self._warmed_up and self.state == 'measuring'
+                and not self.timer.isActive()):
+            self.timer.start()
+
+    def update_charts(self):
+        for w in self.chart_widgets:
+            w.update_plot()
+
+    def closeEvent(self, event):
+        # no redraw may touch the ring once its shared memory is released:
+        # stop the timer and drop already queued notifications first
+        self._warmed_up = False
+        self.timer.stop()
+        self.source.notifier.data_ready.disconnect(self._schedule_update)
+        self.source.notifier.warmed_up.disconnect(self._on_warmed_up)
+        if isinstance(self.source, ProcessDataSource):
+            self.source.close()
+        super().closeEvent(event)
+
     # ------------------------------------------------------------------
     # GUI update from state
     # ------------------------------------------------------------------
@@ -0,0 +1,98 @@
+"""
+Lock-free SPSC ring buffer and plot decimation shared by the chart patterns.
+"""
+
+import numpy as np
+
+
+class SPSCRing:
+    """
+    Single-producer / single-consumer SoA ring of `ncols` float64 columns,
+    time-indexed on the last axis.
+
+    `head` is the total number of samples written, published after the
+    data; `claim` is the head a write in progress will end at, published
+    before the data. `snapshot` copies between a head read and a claim read
+    (seqlock style) and drops the columns the producer may have overwritten
+    meanwhile, so no lock is needed.
+    """
+
+    __slots__ = ('buf', 'cap', '_head', '_claim')
+
+    def __init__(self, cap, ncols, buf=None):
+        self.cap = cap
+        self.buf = np.empty((ncols, cap)) if buf is None else buf
+        self._head = 0
+        self._claim = 0
+
+    def _load_head(self) -> int:
+        return self._head
+
+    def _store_head(self, head: int):
+        self._head = head
+
+    def _load_claim(self) -> int:
+        return self._claim
+
+    def _store_claim(self, claim: int):
+        self._claim = claim
+
+    @property
+    def head(self) -> int:
+        return self._load_head()
+
+    def last(self, row: int):
+        """Newest value of `row`, or None if nothing was written yet."""
+        head = self._load_head()
+        return float(self.buf[row, (head - 1) % self.cap]) if head else None
+
+    def push(self, block):
+        """Append a (ncols, k) block: at most two slice writes."""
+        n = block.shape[1]
+        k = min(n, self.cap)
+        head = self._load_head()
+        self._store_claim(head + n)
+        # a block longer than the ring keeps its last `cap` samples, which
+        # belong at times head + n - k ...
+        start = (head + n - k) % self.cap
+        first = min(k, self.cap - start)
+        block = block[:, -k:]
+        self.buf[:, start:start + first] = block[:, :first]
+        self.buf[:, :k - first] = block[:, first:]
+        self._store_head(head + n)
+
+    def snapshot(self):
+        """Return a time-ordered (ncols, n) copy (never a view of the ring)."""
+        head = self._load_head()
+        n = min(head, self.cap)
+        if head <= self.cap:
+            data = self.buf[:, :head].copy()
+        else:
+            i = head % self.cap
+            data = np.concatenate((self.buf[:, i:], self.buf[:, :i]), axis=1)
+        # oldest columns the producer may have overwritten during the copy
+        torn = self._load_claim() - self.cap - (head - n)
+        return data[:, torn:] if torn > 0 else data
+
+
+def decimate(x, y, n_px):
+    """
+    Min/max decimation of one line to at most ~2 * n_px vertices.
+    The samples are split into n_px buckets and only the per-bucket
+    extrema are kept (in time order), so peaks stay visible.
+    """
+    n_px = int(n_px)
+    if n_px < 1 or x.size <= 2 * n_px:
+        return x, y
+
+    size = x.size // n_px
+    m = size * n_px
+    buckets = y[:m].reshape(n_px, size)
+    offsets = np.arange(n_px) * size
+
+    idx = np.concatenate((buckets.argmin(axis=1) + offsets,
+                          buckets.argmax(axis=1) + offsets))
+    idx.sort()
+    if m < x.size:
+        idx = np.append(idx, x.size - 1)
+    return x[idx], y[idx]
@@ -4,16 +4,18 @@ import datetime
 import time
 
 import sys
+from collections import deque
 
 from typing import Optional, Any, Dict
 
 from sqlalchemy import Integer, Column, DateTime, text
 
 from sqlalchemy import func
+from sqlalchemy import event
 
 from sqlalchemy.orm import declarative_base, Mapped, mapped_column
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine, AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine, AsyncSession, AsyncConnection
 
 import threading
 
@@ -30,6 +32,11 @@ class S(Base):
 
 
 class QueuedWriter():
+    # inserts are coalesced into one transaction of up to this many rows,
+    # waiting at most this long (s) for the batch to fill up
+    INSERT_BATCH_MAX = 64
+    INSERT_BATCH_WINDOW = 0.05
+    
     def __init__(self, logger:logging.Logger = None):
         self.logger = logger
         
@@ -39,7 +46,21 @@ class QueuedWriter():
         self.engine = None
         self.SessionLocal: Optional[async_sessionmaker[AsyncSession]] = None 
         
-        self.queue = asyncio.Queue()
+        # the worker's own connection, kept open for its whole lifetime
+        self._conn: Optional[AsyncConnection] = None
+        
+        # plain deque + one "non-empty" event instead of asyncio.Queue
+        self._dq = deque()
+        self._pending = asyncio.Event()
+        
+        # (row dict, future) pairs waiting for a batched commit
+        self._inserts = deque()
+        
+        # outstanding job counter; _idle is set whenever it drops to 0
+        self._outstanding = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        
         self.lock = asyncio.Lock()
         self._worker_task: Optional[asyncio.Task] = None 
 
@@ -52,27 +73,80 @@ class QueuedWriter():
             except Exception as e:
                 future.set_exception(e)
             finally:
-                self.queue.task_done()
+                self._job_done()
+        
+        self._outstanding += 1
+        self._idle.clear()
+        self._dq.append(wrapped_job)
+        self._pending.set()
+        return future
+    
+    async def _submit_insert(self, row: Dict[str, Any]):
+        future = asyncio.get_running_loop().create_future()
         
-        await self.queue.put(wrapped_job)
+        self._outstanding += 1
+        self._idle.clear()
+        self._inserts.append((row, future))
+        self._pending.set()
         return future
     
+    def _job_done(self):
+        self._outstanding -= 1
+        if self._outstanding == 0:
+            self._idle.set()
+    
         
     async def _worker(self):
+        self._conn = await self.engine.connect()
+        try:
+            await self._worker_loop()
+        finally:
+            await self._conn.close()
+            self._conn = None
+        return True
+    
+    async def _worker_loop(self):
         while True:
-            try:
-                job = await asyncio.wait_for(self.queue.get(), timeout=1)
-            except asyncio.TimeoutError:
+            if self._inserts:
+                await self._flush_inserts()
                 continue
             
+            if not self._dq:
+                await self._pending.wait()
+                self._pending.clear()
+                continue
+            
+            job = self._dq.popleft()
             if job is None:
-                self.queue.task_done() 
                 break
             
             async with self.lock:
                 await job()
-
-        return True
+    
+    async def _flush_inserts(self):
+        if len(self._inserts) < self.INSERT_BATCH_MAX:
+            await asyncio.sleep(self.INSERT_BATCH_WINDOW)
+        
+        n = min(len(self._inserts), self.INSERT_BATCH_MAX)
+        batch = [self._inserts.popleft() for _ in range(n)]
+        
+        try:
+            async with self.lock:
+                # Core executemany on the persistent connection: no session,
+                # identity map or refresh round trip per batch
+                async with self._conn.begin():
+                    await self._conn.execute(
+                        S.__table__.insert(), [row for row, _ in batch]
+                    )
+            self.logger.debug(f"Committed {n} rows")
+            for _, future in batch:
+                future.set_result(True)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+        finally:
+            for _ in batch:
+                self._job_done()
 
     
     async def initialize_db(self) -> bool:
@@ -85,6 +159,15 @@ class QueuedWriter():
                 echo=False,               # SQL log
             )
             
+            # WAL + synchronous=NORMAL: no fsync per commit, only at checkpoints
+            @event.listens_for(self.engine.sync_engine, "connect")
+            def _set_sqlite_pragma(dbapi_conn, _):
+                cursor = dbapi_conn.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute("PRAGMA synchronous=NORMAL")
+                cursor.execute("PRAGMA temp_store=MEMORY")
+                cursor.close()
+            
             self.SessionLocal = async_sessionmaker(
                 bind=self.engine, 
                 expire_on_commit=False,
@@ -102,16 +185,11 @@ class QueuedWriter():
    
     
     
-    async def add_sample(self) -> bool:
-        async with self.SessionLocal() as sess: 
-            obj = S()
-            sess.add(obj)
-            self.logger.debug(f"Before commit")
-            await sess.commit()
-            self.logger.debug(f"After commit")
-            await sess.refresh(obj)
-            self.logger.debug(f"Object refreshed")
-        return True
+    async def add_sample(self) -> asyncio.Future:
+        # resolved by the worker once the batch containing it is committed
+        return await self._submit_insert(
+            {"timestamp": datetime.datetime.now(datetime.timezone.utc)}
+        )
         
     
     async def get_num_of_samples(self) -> int:
@@ -128,7 +206,7 @@ class QueuedWriter():
         
         while not self._stop.is_set():
             next_time = next_time + 1.0
-            await self._submit_job(self.add_sample)
+            await self.add_sample()
             
             delay = next_time - time.monotonic()
             if delay > 0:
@@ -152,11 +230,12 @@ class QueuedWriter():
         self.logger.info("Main loop stopped.")
 
         # 3. Várjuk meg, amíg a queue-ban lévő ÖSSZES feladat feldolgozásra kerül
-        await self.queue.join()
+        await self._idle.wait()
         self.logger.info("All queue tasks processed.")
 
         # 4. Küldd el a None jelet a workernek, hogy a ciklusa befejeződjön
-        await self.queue.put(None)
+        self._dq.append(None)
+        self._pending.set()
         
         # 5. Várd meg a worker task tényleges befejezését
         await self._worker_task
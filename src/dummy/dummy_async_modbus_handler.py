@@ -38,9 +38,14 @@ class DummyAsyncModbusHandler(AsyncModbusHandler):
         # dynamic sampling status (default = fixed or NORMAL)
         self.sampling_status = self.fixed.get(self.SAMPLING_STATUS_REGISTER, 0)
 
-    async def _simulate_delay(self):
-        if self.delay > 0:
-            await asyncio.sleep(self.delay)
+        # private generator; ranges kept as (lo, span) so reads skip randint's argument checks
+        self._rng = random.Random()
+        self._range_table: Dict[int, Tuple[int, int]] = {
+            reg: (lo, hi - lo + 1) for reg, (lo, hi) in self.random_ranges.items()
+        }
+
+        # register -> zero-arg value source, built once
+        self._dispatch: Dict[int, Callable[[], Any]] = self._build_dispatch()
 
     # ---------------------------
     # External control function
@@ -52,46 +57,61 @@ class DummyAsyncModbusHandler(AsyncModbusHandler):
     # ---------------------------
     # Dummy value generator
     # ---------------------------
-    def _get_dummy_value(self, query: ModbusQuery):
-        reg = query.register
+    def _inc_counter(self, reg: int):
+        self.counters[reg] += 1
+        return self.counters[reg]
 
-        # sampling status always comes from internal state, not from fixed[]
-        if reg == self.SAMPLING_STATUS_REGISTER:
-            return self.sampling_status
+    def _build_dispatch(self) -> Dict[int, Callable[[], Any]]:
+        # filled from lowest to highest priority, later entries win
+        dispatch: Dict[int, Callable[[], Any]] = {}
 
-        # custom generators
-        if reg in self.generators:
-            return self.generators[reg]()
+        # random ranges
+        randbelow = self._rng._randbelow
+        for reg, (lo, span) in self._range_table.items():
+            dispatch[reg] = (lambda lo=lo, span=span: lo + randbelow(span))
+
+        # counters
+        for reg in self.counters:
+            dispatch[reg] = (lambda r=reg: self._inc_counter(r))
 
         # fixed
-        if reg in self.fixed:
-            return self.fixed[reg]
+        for reg, v in self.fixed.items():
+            dispatch[reg] = (lambda v=v: v)
 
-        # counters
-        if reg in self.counters:
-            self.counters[reg] += 1
-            return self.counters[reg]
+        # custom generators
+        dispatch.update(self.generators)
 
-        # random ranges
-        if reg in self.random_ranges:
-            lo, hi = self.random_ranges[reg]
-            return random.randint(lo, hi)
+        # sampling status always comes from internal state, not from fixed[]
+        dispatch[self.SAMPLING_STATUS_REGISTER] = lambda: self.sampling_status
 
-        return 0
+        return dispatch
+
+    def _get_dummy_value(self, query: ModbusQuery):
+        fn = self._dispatch.get(query.register)
+        return fn() if fn else 0
 
     # ---------------------------
     # Overrides
+    # (the artificial delay is checked inline so a zero-delay call never creates a coroutine for it)
     # ---------------------------
     async def read_input(self, query: ModbusQuery):
-        await self._simulate_delay()
+        if self.delay > 0:
+            await asyncio.sleep(self.delay)
         return self._get_dummy_value(query)
 
+    async def read_input_block(self, queries):
+        if self.delay > 0:
+            await asyncio.sleep(self.delay)
+        return [self._get_dummy_value(q) for q in queries]
+
     async def read_holding(self, query: ModbusQuery):
-        await self._simulate_delay()
+        if self.delay > 0:
+            await asyncio.sleep(self.delay)
         return self._get_dummy_value(query)
 
     async def write_coil(self, query: ModbusQuery, value):
-        await self._simulate_delay()
+        if self.delay > 0:
+            await asyncio.sleep(self.delay)
         reg = query.register
 
         # if coil #2 is written → change sampling status
@@ -102,7 +122,8 @@ class DummyAsyncModbusHandler(AsyncModbusHandler):
         return True
 
     async def write_register(self, query: ModbusQuery, value):
-        await self._simulate_delay()
+        if self.delay > 0:
+            await asyncio.sleep(self.delay)
         reg = query.register
         self.written_values[reg] = value
         return True
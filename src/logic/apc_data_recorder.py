@@ -1,11 +1,17 @@
-from typing import Union, Optional, Dict, Callable, Deque, List
-from collections import deque
+from typing import Union, Optional, Dict, Callable, List
 from dataclasses import dataclass, field
 import logging
+import logging.handlers
+import queue
 import asyncio
 import threading
+import os
+import sys
 import time
 import datetime
+import operator
+
+import numpy as np
 
 from transitions import Machine
 
@@ -16,55 +22,114 @@ from .config_handler import AppConfig, AppConfigHandler
 from ..services.async_modbus_handler import AsyncModbusConnection, AsyncModbusHandler, ModbusException
 from ..services.async_db_handler import AsyncDBHandler
 
-from .apc_sample import APCSample
+from .apc_sample import APCSample, APCSampleRow
 from .apc_instrument import PmtApcInstrument
 
 class ApcDataRecorderException(Exception):
     pass
 
-@dataclass
+
+def _set_future_done(fut: asyncio.Future):
+    if not fut.done():
+        fut.set_result(None)
+
+
+def _pin_current_thread(cpu: int) -> bool:
+    """
+    Pin the calling thread to a single CPU core.
+    Returns False if the platform offers no way to do it.
+    """
+    if hasattr(os, "sched_setaffinity"):
+        # on Linux pid 0 addresses the calling thread, not the whole process
+        os.sched_setaffinity(0, {cpu})
+        return True
+    if sys.platform == "win32":
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        return bool(kernel32.SetThreadAffinityMask(kernel32.GetCurrentThread(), 1 << cpu))
+    return False
+
+
+def _stamp_local_time(sample: APCSampleRow, local_dt: datetime.datetime):
+    sample.local_datetime = local_dt
+    sample.local_unix_timestamp = int(local_dt.timestamp())
+
+
+@dataclass(slots=True)
 class ApcRecordSession():
     session_id:int
     flow:float
     deque_len: int
 
+    # channel order, resolved once at class creation (not a dataclass field)
+    _CHANNEL_NAMES = tuple(c.channel_name for c in PmtApcInstrument.CHANNELS)
+    # fetches all channel values of a sample as a tuple in one C call
+    _CHANNEL_GETTER = operator.attrgetter(*_CHANNEL_NAMES)
+
     session_start:Optional[int] = None # monotonic timestamp
     session_end:Optional[int] = None # monotonic timestamp
 
-    live_data: Dict[str, Deque[int]] = field(default_factory=dict)
-    accumulator: Dict[str, int] = field(default_factory=dict)
+    # fixed-capacity ring per channel, written at num_of_samples % deque_len;
+    # the values are row views of one (n_channels, deque_len) array
+    live_data: Dict[str, np.ndarray] = field(init=False, default_factory=dict)
 
     num_of_samples:int = 0
     time_elapsed: int = 0
 
+    # monotonic clock; the recorder passes its event loop's `loop.time`
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False)
+
+    # backing arrays, declared as fields so they get a slot
+    _live_2d: np.ndarray = field(init=False, repr=False)
+    _accum: np.ndarray = field(init=False, repr=False)
+
     def __post_init__(self):
-        for channel in PmtApcInstrument.CHANNELS:
-            self.live_data[channel.channel_name] = deque(maxlen=self.deque_len)
-            self.accumulator[channel.channel_name] = 0
+        n = len(self._CHANNEL_NAMES)
+        self._live_2d = np.zeros((n, self.deque_len), dtype=np.int64)
+        self._accum = np.zeros(n, dtype=np.int64)
+        self.live_data = dict(zip(self._CHANNEL_NAMES, self._live_2d))
+
+    @property
+    def accumulator(self) -> Dict[str, int]:
+        return dict(zip(self._CHANNEL_NAMES, self._accum.tolist()))
     
     @staticmethod
     def form_db(sample_list:List[APCSample]):
         raise NotImplementedError()
         pass
 
-    def add_sample(self, sample:APCSample):
+    def add_sample(self, sample:Union[APCSample, APCSampleRow], now:Optional[float] = None):
+        """`now` lets the caller pass a clock reading it already has."""
         if not sample.is_valid:
             return False
 
+        if now is None:
+            now = self.clock()
+
         if self.session_start is None: # implicitly starts 
-            self.session_start = time.monotonic()
+            self.session_start = now
 
-        for channel in PmtApcInstrument.CHANNELS:
-            self.live_data[channel.channel_name].append(sample[channel.channel_name])
-            self.accumulator[channel.channel_name]+=sample[channel.channel_name]
+        vals = np.array(self._CHANNEL_GETTER(sample), dtype=np.int64)
+        self._live_2d[:, self.num_of_samples % self.deque_len] = vals
+        self._accum += vals
         
-        self.time_elapsed = int(time.monotonic() - self.session_start)
+        self.time_elapsed = int(now - self.session_start)
         self.num_of_samples +=1
 
         return True
     
     def end_session(self):
-        self.session_end = time.monotonic()
+        self.session_end = self.clock()
+
+    def live_window(self, channel_name: str) -> np.ndarray:
+        """
+        Last (at most deque_len) values of a channel, oldest first.
+        """
+        buf = self.live_data[channel_name]
+        if self.num_of_samples <= self.deque_len:
+            return buf[:self.num_of_samples]
+        head = self.num_of_samples % self.deque_len
+        return np.concatenate((buf[head:], buf[:head]))
 
     # -------------------------
     # Helper functions
@@ -112,11 +177,21 @@ class ApcDataRecorder():
         self._thread: Optional[threading.Thread] = None
         self._thread_started = threading.Event()
 
-        # stop events (thread-safe and async)
-        self._stop_event = threading.Event()        # used for thread-based stop signalling
+        # stop signalling: plain flag + per-loop asyncio Events
+        self._stop_requested = False  # stop flag; set/read only, the waitables are the asyncio Events below
         self._async_stop: Optional[asyncio.Event] = None  # created per-loop
+        self._tick: Optional[asyncio.Future] = None  # sampling loop's pending pacing wakeup
+        self._health_probe: Optional[asyncio.Event] = None  # set by the sampling loop to wake the watchdog
+        self._thread_stop: Optional[asyncio.Event] = None  # background loop's mirror of _stop_requested
         self._sampling_started = False
 
+        # last sampling status read from the instrument and its loop.time()
+        self._last_sampling_status = None
+        self._last_sampling_status_time = float("-inf")
+
+        # loop.time() of the last successful channel read of the sampling loop
+        self._last_read_ok_time = float("-inf")
+
         # logger
         self.logger = logging.getLogger("ApcDataRecorder")
         self.logger.setLevel(logging.DEBUG)
@@ -127,14 +202,22 @@ class ApcDataRecorder():
         self.callback_handler.setFormatter(formatter)
         self.logger.addHandler(self.callback_handler)
 
+        # file/console output is written by a QueueListener thread, so the
+        # event loop never blocks on log I/O
+        self._log_listener: Optional[logging.handlers.QueueListener] = None
+        self._log_listener_running = False
+        self._log_listener_lock = threading.Lock()
         if file_logger:
             file_handler = logging.FileHandler("apcdatarecorder.log")
             file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
 
             #TODO DEBUG
             console_handler = logging.StreamHandler() 
-            self.logger.addHandler(console_handler)
+
+            log_queue = queue.SimpleQueue()
+            self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+            self._log_listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+            self._start_log_listener()
 
         # GUI state change callback
         self.state_change_callback = None
@@ -187,8 +270,9 @@ class ApcDataRecorder():
                 self.modbus_handler = AsyncModbusHandler(connection=self.modbus_connection, logger=self.logger, test_address= 30164)
                 # public check that DOES NOT reconnect
 
+                # start() returns with the connection open and the worker running;
+                # the health check is simply the first job in its queue
                 await self.modbus_handler.start()
-                await asyncio.sleep(0.3)
                 ok = await self.modbus_handler.check_connection()
                 if not ok:
                     raise ModbusException("Initial modbus health-check failed")
@@ -229,10 +313,37 @@ class ApcDataRecorder():
         self.instrument_initialized = True
         return True
 
+    def _start_log_listener(self):
+        with self._log_listener_lock:
+            if self._log_listener is not None and not self._log_listener_running:
+                self._log_listener.start()
+                self._log_listener_running = True
+
+    def _stop_log_listener(self):
+        """
+        Flush and stop the log listener; safe to call more than once. Records
+        queued after an earlier stop are written out synchronously.
+        """
+        with self._log_listener_lock:
+            listener = self._log_listener
+            if listener is None:
+                return
+            if self._log_listener_running:
+                listener.stop()
+                self._log_listener_running = False
+                return
+            while True:
+                try:
+                    record = listener.queue.get_nowait()
+                except queue.Empty:
+                    break
+                listener.handle(record)
+
     async def initialize(self) -> bool:
         """
         Initialize all components. Must be called before start_recording.
         """
+        self._start_log_listener()
         if not self._initialize_config():
             return False
 
@@ -332,12 +443,98 @@ class ApcDataRecorder():
     # Sampling loop + watchdog
     # -------------------------
 
+    # samples are persisted in batches by a writer task: flushed when this
+    # many are pending or when the oldest pending one is this old (s)
+    DB_BATCH_MAX = 32
+    DB_FLUSH_INTERVAL = 2.0
+
+    async def _flush_samples(self, pending: List[APCSampleRow]):
+        if not pending:
+            return
+        try:
+            await self.db_handler.add_sample_rows(pending, session_id=self.record_session.session_id)
+        except Exception as e:
+            self.logger.error(f"Failed to persist {len(pending)} sample(s) to DB")
+            self.logger.exception(e)
+        finally:
+            pending.clear()
+
+    @staticmethod
+    def _start_retry_delay(trial: int) -> float:
+        # exponential backoff for starting the instrument: 50 ms, 100 ms, ... capped at 1 s
+        return min(0.05 * 2 ** trial, 1.0)
+
+    def _request_stop(self):
+        """Set the sampling stop event and cut a pending pacing sleep short."""
+        if self._async_stop is not None:
+            self._async_stop.set()
+        if self._tick is not None:
+            _set_future_done(self._tick)
+
+    async def _pace_until(self, loop: asyncio.AbstractEventLoop, deadline: float, resolution: float):
+        """
+        Wake up at `deadline` (loop.time() base) via loop.call_at, pushed back by
+        the clock resolution so it never fires early: one future + one call_at
+        handle, resolved early by _request_stop().
+        """
+        if self._async_stop.is_set():
+            return
+        if deadline <= loop.time():
+            await asyncio.sleep(0)
+            return
+
+        fut = loop.create_future()
+        handle = loop.call_at(deadline + resolution, _set_future_done, fut)
+        self._tick = fut
+        try:
+            await fut
+        finally:
+            handle.cancel()
+            self._tick = None
+
+    async def _db_writer_loop(self, queue: asyncio.Queue):
+        """
+        Drains `queue` into batched DB inserts until a None sentinel arrives;
+        everything queued before the sentinel is written.
+        """
+        loop = asyncio.get_running_loop()
+        batch: List[APCSampleRow] = []
+        done = False
+        while not done:
+            item = await queue.get()
+            if item is None:
+                break
+            batch.append(item)
+
+            deadline = loop.time() + self.DB_FLUSH_INTERVAL
+            while len(batch) < self.DB_BATCH_MAX:
+                try:
+                    item = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(queue.get(), timeout=remaining)
+                    except asyncio.TimeoutError:
+                        break
+                if item is None:
+                    done = True
+                    break
+                batch.append(item)
+
+            await self._flush_samples(batch)
+
     async def _sampling_loop(self):
         if not self.is_initialized:
             self.logger.error("Cannot start sampling: recorder not initialized.")
             return False
 
         interval = self.config.sampling_step / 1000.0  # ms → sec
+        # the loop's own clock: same time base as its sleep deadlines
+        loop = asyncio.get_running_loop()
+        monotonic = loop.time
+        resolution = loop.clock_resolution
         self._async_stop = asyncio.Event()
         self._sampling_started = False
 
@@ -347,26 +544,26 @@ class ApcDataRecorder():
             start_success = False
             while True:
                 try:
-                    self.logger.debug(f"Attempting to start sampling (trial {start_trials})")
+                    self.logger.debug("Attempting to start sampling (trial %d)", start_trials)
                     start_success = await self.instrument.async_start_sampling()
-                    self.logger.debug(f"async_start_sampling() returned: {start_success}")
+                    self.logger.debug("async_start_sampling() returned: %s", start_success)
                     if start_success:
                         self.logger.info("Sampling started successfully on instrument")
                         break
                     if start_trials > 4:
                         self.logger.error(f"Max start trials ({start_trials}) exceeded")
                         break
+                    await asyncio.sleep(self._start_retry_delay(start_trials))
                     start_trials += 1
-                    await asyncio.sleep(1.0)
                 except Exception as e:
                     # swallow, try again
-                    self.logger.debug(f"Exception during start attempt {start_trials}: {e}")
+                    self.logger.debug("Exception during start attempt %d: %s", start_trials, e)
+                    await asyncio.sleep(self._start_retry_delay(start_trials))
                     start_trials += 1
-                    await asyncio.sleep(0.2)
 
             if not start_success:
                 self.logger.error("Unable to start sampling")
-                self._async_stop.set()
+                self._request_stop()
                 return False
 
             # ensure last session closed (optional – if you want to force-close previous)
@@ -384,7 +581,8 @@ class ApcDataRecorder():
             self.record_session = ApcRecordSession(
                 session_id=current_session_id,
                 flow=(flow / 1000.0) if flow is not None else 0.0,
-                deque_len=self.config.live_window_len
+                deque_len=self.config.live_window_len,
+                clock=monotonic
             )
 
         except Exception as e:
@@ -392,52 +590,68 @@ class ApcDataRecorder():
             self.logger.exception(e)
             return False
 
+        # hot-path lookups, bound once for both loops below
+        SAMPLING = self.instrument.SamplingStatus.SAMPLING
+        read_channels = self.instrument.async_read_channels
+        record_sample = self.record_session.add_sample
+        # plain staging rows, not ORM instances: written with one bulk INSERT per batch
+        sample_from_dict = APCSampleRow.from_dict
+        stop_is_set = self._async_stop.is_set
+        pace = self._pace_until
+
         # prepare timing
-        next_time = time.monotonic()
+        # deadlines are base + ticks * interval, so float error does not accumulate over a long session
+        tick_base = monotonic()
+        ticks = 0
+        next_time = tick_base
         sample = None
         start_time = None
 
         # WAIT FOR REAL VALID SAMPLE -> mark session as started only when first good sample arrives
         wait_attempts = 0
         max_wait_attempts = 100  # timeout: ~10 seconds at 1 sample/sec
+        # never carry a status over from a previous session
+        self._last_sampling_status_time = float("-inf")
         
-        while not self._async_stop.is_set():
+        while not stop_is_set():
             try:
-                next_time += interval
+                ticks += 1
+                next_time = tick_base + ticks * interval
                 wait_attempts += 1
 
-                status = await self.instrument.async_read_sampling_status()
-                self.logger.debug(f"[Wait Sample] Status: {status}, Attempt: {wait_attempts}")
+                status = await self._cached_sampling_status()
+                self.logger.debug("[Wait Sample] Status: %s, Attempt: %d", status, wait_attempts)
                 
-                if status == self.instrument.SamplingStatus.SAMPLING:
-                    data = await self.instrument.async_read_channels()
-                    self.logger.debug(f"[Wait Sample] Channel data: {data}")
+                if status == SAMPLING:
+                    data = await read_channels()
+                    self.logger.debug("[Wait Sample] Channel data: %s", data)
                     
-                    sample = APCSample.from_dict(data)
+                    sample = sample_from_dict(data)
 
                     is_valid = sample.is_valid
 
-                    self.logger.debug(f"[Wait Sample] Sample valid: {is_valid}")
+                    self.logger.debug("[Wait Sample] Sample valid: %s", is_valid)
                     if is_valid:
+                        # wall-clock anchor of the session: per-sample local times are
+                        # derived from it and the loop clock, never re-read from the wall clock
+                        wall_anchor = datetime.datetime.now(datetime.timezone.utc)
+                        start_time = monotonic()
                         # explicitly pass the session id returned earlier.
                         # don't rely on db_handler internal session_id unless you set it.
                         await self.db_handler.start_sampling_session(session_id=self.record_session.session_id,
-                                                                    start_time=datetime.datetime.now(datetime.timezone.utc))
-                        start_time = time.monotonic()
+                                                                    start_time=wall_anchor)
                         self._sampling_started = True
                         self.logger.info(f"Sampling session started (ID={self.record_session.session_id})")
                         break
                 else:
-                    self.logger.debug(f"[Wait Sample] Not in SAMPLING state, current: {status}")
+                    self.logger.debug("[Wait Sample] Not in SAMPLING state, current: %s", status)
 
                 # timeout check
                 if wait_attempts > max_wait_attempts:
                     self.logger.error(f"Timeout waiting for first valid sample after {max_wait_attempts} attempts")
                     return False
 
-                delay = next_time - time.monotonic()
-                if delay > 0:
-                    await asyncio.sleep(delay)
+                await pace(loop, next_time, resolution)
             except asyncio.CancelledError:
                 self.logger.info("Sampling task cancelled externally - before actual sampling started...")
                 return False
@@ -446,9 +660,10 @@ class ApcDataRecorder():
                 self.logger.exception(e)
                 return False
 
-        # double-check we have a valid sample
-        if not isinstance(sample, APCSample):
-            self.logger.warning("No APCSample obtained at session start - aborting sampling.")
+        # the wait loop only sets _sampling_started after a valid sample, so that flag
+        # covers both "no sample" and "invalid sample" (stop arrived while waiting)
+        if not self._sampling_started:
+            self.logger.warning("No valid sample obtained at session start - aborting sampling.")
             # try to cleanup
             try:
                 await self.instrument.async_stop_sampling()
@@ -457,53 +672,51 @@ class ApcDataRecorder():
                 pass
             return False
 
-        is_valid = sample.is_valid
-        if not is_valid:
-            self.logger.warning("First sample considered invalid after check - aborting.")
-            try:
-                await self.instrument.async_stop_sampling()
-                await self.db_handler.end_sampling_session(session_id=self.record_session.session_id)
-            except Exception:
-                pass
-            return False
-
         # --- actual sampling loop ---
         # note: we already consumed the first valid sample into `sample`
         # add it to record and DB
+        # DB writes run in their own task; the loop only enqueues
+        db_queue: asyncio.Queue = asyncio.Queue()
+        db_writer = asyncio.create_task(self._db_writer_loop(db_queue))
+        enqueue_sample = db_queue.put_nowait
+        consecutive_failures = 0
         try:
             # Add first sample
-            self.record_session.add_sample(sample)  # record local sliding-window
-            await self.db_handler.add_sample(sample, session_id=self.record_session.session_id)
+            record_sample(sample, start_time)  # record local sliding-window; reuse the start reading
+            _stamp_local_time(sample, wall_anchor)
+            enqueue_sample(sample)
 
             # continue periodic sampling
-            while not self._async_stop.is_set():
-                next_time += interval
+            while not stop_is_set():
+                ticks += 1
+                next_time = tick_base + ticks * interval
                 try:
-                    data = await self.instrument.async_read_channels()
-                    sample = APCSample.from_dict(data)
+                    data = await read_channels()
+                    # one clock read per iteration, taken when the sample arrived
+                    now = monotonic()
+                    self._last_read_ok_time = now
+                    consecutive_failures = 0
+                    sample = sample_from_dict(data)
 
                     # add to in-memory session
                     try:
-                        self.record_session.add_sample(sample)
+                        record_sample(sample, now)
                     except Exception:
                         self.logger.debug("record_session.add_sample() failed for a sample (ignored).")
 
-                    # persist to DB
-                    try:
-                        await self.db_handler.add_sample(sample, session_id=self.record_session.session_id)
-                    except Exception as e:
-                        self.logger.error("Failed to persist sample to DB")
-                        self.logger.exception(e)
+                    # persist to DB, batched by the writer task; stamp the acquisition
+                    # time now, the row defaults would only be evaluated at flush time
+                    _stamp_local_time(sample, wall_anchor + datetime.timedelta(seconds=now - start_time))
+                    enqueue_sample(sample)
 
                     # drift-free sleep
-                    delay = next_time - time.monotonic()
-                    if delay > 0:
-                        await asyncio.sleep(delay)
-                    else:
+                    delay = next_time - now
+                    if delay <= 0:
                         self.logger.warning(f"Sampling drift ({-delay:.3f}s behind schedule)")
+                    await pace(loop, next_time, resolution)
 
-                    # time limit for session
-                    if self._sampling_started and (time.monotonic() - start_time >= self.config.sampling_time):
+                    # time limit for session; after the sleep the clock is at next_time
+                    if self._sampling_started and (next_time - start_time >= self.config.sampling_time):
                         break
 
                 except asyncio.CancelledError:
@@ -512,10 +725,22 @@ class ApcDataRecorder():
                 except Exception as e:
                     self.logger.error("Error during sampling loop iteration")
                     self.logger.exception(e)
+                    # repeated failures: have the watchdog check the system now
+                    consecutive_failures += 1
+                    if consecutive_failures >= self.SAMPLING_FAILURES_TO_PROBE and self._health_probe is not None:
+                        self._health_probe.set()
                     # brief backoff before continuing
-                    await asyncio.sleep(min(interval, 0.5))
+                    await pace(loop, monotonic() + min(interval, 0.5), resolution)
 
         finally:
+            # let the writer persist whatever is still queued before the session is closed
+            db_queue.put_nowait(None)
+            try:
+                await db_writer
+            except Exception as e:
+                self.logger.error("DB writer task failed")
+                self.logger.exception(e)
+
             # Stop instrument + DB session; don't stop worker threads here — close_connections handles that
             try:
                 await self.instrument.async_stop_sampling()
@@ -537,53 +762,121 @@ class ApcDataRecorder():
         return True
 
 
+    # a cached SAMPLING status younger than this (s) is reused
+    SAMPLING_STATUS_MAX_AGE = 2.0
+
+    async def _read_sampling_status(self):
+        status = await self.instrument.async_read_sampling_status()
+        self._last_sampling_status = status
+        self._last_sampling_status_time = asyncio.get_running_loop().time()
+        return status
+
+    async def _cached_sampling_status(self):
+        """
+        Last status if it is SAMPLING and fresh enough, else read it.
+        Any other status is re-read, so the wait phase never trusts a stale
+        NOT_SAMPLING.
+        """
+        age = asyncio.get_running_loop().time() - self._last_sampling_status_time
+        if (self._last_sampling_status == self.instrument.SamplingStatus.SAMPLING
+                and age <= self.SAMPLING_STATUS_MAX_AGE):
+            return self._last_sampling_status
+        return await self._read_sampling_status()
+
+    # watchdog: full check every WATCHDOG_KEEPALIVE s, or at once when the sampling
+    # loop reports SAMPLING_FAILURES_TO_PROBE failed iterations in a row; while a
+    # probe is failing it is rechecked every WATCHDOG_TICK s, and a probe failing
+    # WATCHDOG_MAX_FAILURES times in a row stops the sampling
+    WATCHDOG_KEEPALIVE = 30.0
+    WATCHDOG_TICK = 2.0
+    WATCHDOG_MAX_FAILURES = 2
+    SAMPLING_FAILURES_TO_PROBE = 3
+    # a channel read of the sampling loop younger than this (s) proves the MODBUS link
+    MODBUS_READ_MAX_AGE = 5.0
+
+    async def _probe_modbus(self) -> bool:
+        age = asyncio.get_running_loop().time() - self._last_read_ok_time
+        if age <= self.MODBUS_READ_MAX_AGE:
+            return True
+        ok = await self.modbus_handler.check_connection()
+        if not ok:
+            self.logger.error("Watchdog: MODBUS Connection lost.")
+        return ok
+
+    async def _probe_instrument(self) -> bool:
+        status = await self.instrument.async_read_device_status()
+        if status != self.instrument.DeviceStatus.NORMAL:
+            self.logger.critical("Watchdog: Instrument status is abnormal!")
+            return False
+
+        sampling_status = await self._read_sampling_status()
+        if sampling_status != self.instrument.sampling_status:
+            self.logger.critical("Watchdog: Instrument SAMPLING STATUS is falsely registrated.")
+            return False
+        if self._sampling_started and sampling_status != self.instrument.SamplingStatus.SAMPLING:
+            self.logger.critical("Watchdog: sampling stopped unexpectedly.")
+            return False
+        return True
+
+    async def _probe_db(self) -> bool:
+        ok = await self.db_handler.check_connection()
+        if not ok:
+            self.logger.error("Watchdog: Database Connection lost.")
+        return ok
+
     async def _watchdog_loop(self):
         """
-        Periodically checks instrument and sampling health.
-        If abnormal condition detected, stops the sampling.
+        Checks instrument and sampling health. Sleeps until the keepalive
+        deadline or until the sampling loop signals repeated failures via
+        _health_probe, then runs all probes (MODBUS, instrument, DB). If
+        abnormal condition detected, stops the sampling.
         """
         if not self.is_initialized:
             self.logger.warning("Watchdog cannot start: recorder not initialized.")
             return
 
+        self._health_probe = asyncio.Event()
         await asyncio.sleep(5.0) # initial delay
+        loop = asyncio.get_running_loop()
+
+        probes = (self._probe_modbus, self._probe_instrument, self._probe_db)
+        failures = [0] * len(probes)
 
         self.logger.info("Watchdog task started.")
-        interval = 5.0  # check every 10.0 second
-        next_time = time.monotonic() + interval
+        next_time = loop.time()
         try:
             while True:
-                # exit if no sampling task
+                # idle while there is no sampling task
                 if self._sampling_task is None or self._sampling_task.done():
-                    await asyncio.sleep(interval)
+                    await asyncio.sleep(self.WATCHDOG_TICK)
+                    next_time = loop.time()
                     continue
 
-                # check instrument health
                 try:
-                    health_ok = await self.health_check()
-                    if not health_ok:
-                        self.logger.critical("Watchdog detected unhealthy system, stopping sampling!")
-                        await self.manual_stop_sampling()
-                        break
-                except Exception as e:
-                    self.logger.error("Watchdog error during health check")
-                    self.logger.exception(e)
+                    await asyncio.wait_for(self._health_probe.wait(), timeout=max(next_time - loop.time(), 0.0))
+                    self.logger.warning("Watchdog woken by repeated sampling failures.")
+                except asyncio.TimeoutError:
+                    pass
+                self._health_probe.clear()
 
-                # if sampling started, also check sampling status
-                if self._sampling_started:
+                unhealthy = False
+                for i, probe in enumerate(probes):
                     try:
-                        status = await self.instrument.async_read_sampling_status()
-                        if status != self.instrument.SamplingStatus.SAMPLING:
-                            self.logger.critical("Watchdog detected sampling stopped unexpectedly, stopping task!")
-                            await self.manual_stop_sampling()
-                            break
+                        ok = await probe()
                     except Exception as e:
-                        self.logger.error("Watchdog error reading sampling status")
+                        self.logger.error(f"Watchdog error in {probe.__name__}")
                         self.logger.exception(e)
-                delay= next_time - time.monotonic()
-                if delay>0:
-                    await asyncio.sleep(interval)
-                next_time +=interval
+                        ok = False
+                    failures[i] = 0 if ok else failures[i] + 1
+                    unhealthy = unhealthy or failures[i] >= self.WATCHDOG_MAX_FAILURES
+
+                if unhealthy:
+                    self.logger.critical("Watchdog detected unhealthy system, stopping sampling!")
+                    await self.manual_stop_sampling()
+                    break
+
+                # recheck soon while something is failing, otherwise wait for the keepalive
+                next_time = loop.time() + (self.WATCHDOG_TICK if any(failures) else self.WATCHDOG_KEEPALIVE)
 
         except asyncio.CancelledError:
             self.logger.info("Watchdog task cancelled.")
@@ -614,7 +907,7 @@ class ApcDataRecorder():
             raise ApcDataRecorderException("Recorder already running.")
 
         # clear stop indicators
-        self._stop_event.clear()
+        self._stop_requested = False
         self._async_stop = asyncio.Event()
 
         # spawn tasks
@@ -634,9 +927,8 @@ class ApcDataRecorder():
             return True
 
         # signal stop
-        self._stop_event.set()
-        if self._async_stop is not None and not self._async_stop.is_set():
-            self._async_stop.set()
+        self._stop_requested = True
+        self._request_stop()
 
         # wait for sampling task to finish
         try:
@@ -651,13 +943,13 @@ class ApcDataRecorder():
                 except Exception:
                     pass
 
-        # cancel watchdog
-        try:
-            if self._watchdog_task:
-                self._watchdog_task.cancel()
-                await asyncio.sleep(0)  # allow cancellation propagation
-        except Exception:
-            pass
+        # cancel watchdog and wait until it has actually finished
+        if self._watchdog_task:
+            self._watchdog_task.cancel()
+            try:
+                await self._watchdog_task
+            except (asyncio.CancelledError, Exception):
+                pass
 
         self.logger.info("Recording stopped.")
         self.on_state_change('stopped')
@@ -670,22 +962,38 @@ class ApcDataRecorder():
     def _thread_main(self):
         """
         Entry point for the background thread: creates an asyncio loop and runs start/stop there.
-        Fully async-safe: uses await asyncio.sleep() instead of blocking time.sleep().
+        Fully async-safe: waits on an asyncio.Event woken by stop_thread(), no polling.
         """
         self._loop = asyncio.new_event_loop()
+        self._loop.set_debug(False)
         asyncio.set_event_loop(self._loop)
-        self._thread_started.set()
 
         async def _main_async():
             try:
+                # set from stop_thread() via call_soon_threadsafe
+                self._thread_stop = asyncio.Event()
+                self._thread_started.set()
+                if self._stop_requested:
+                    self._thread_stop.set()
+
                 # Initialize all components
                 await self.initialize()
+
+                # optional: keep the sampling thread on one core (less scheduler migration jitter)
+                cpu = self.config.sampling_cpu if self.config is not None else None
+                if cpu is not None:
+                    try:
+                        if _pin_current_thread(cpu):
+                            self.logger.info("Recorder thread pinned to CPU %d", cpu)
+                        else:
+                            self.logger.warning("CPU pinning is not supported on this platform.")
+                    except OSError as e:
+                        self.logger.warning("Could not pin recorder thread to CPU %d: %s", cpu, e)
                 # Start recording
                 await self.start_recording()
 
-                # Keep running until stop_event is set
-                while not self._stop_event.is_set():
-                    await asyncio.sleep(1.0)
+                # Keep running until stop_thread() wakes us (no polling)
+                await self._thread_stop.wait()
 
                 # Stop tasks gracefully
                 await self.stop_recording()
@@ -741,7 +1049,7 @@ class ApcDataRecorder():
 
         # ensure config is loaded and components are available on the thread
         # thread will call initialize() itself
-        self._stop_event.clear()
+        self._stop_requested = False
         
         self.init_thread()
 
@@ -765,64 +1073,112 @@ class ApcDataRecorder():
             self.logger.info("Recorder thread not running.")
             return True
 
-        self._stop_event.set()
+        self._stop_requested = True
+        if self._loop is not None and self._thread_stop is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._thread_stop.set)
+            except RuntimeError:
+                # loop already closed
+                pass
         self._thread.join(timeout=wait_for_join)
         if self._thread.is_alive():
             self.logger.warning("Recorder thread did not stop within timeout.")
         else:
             self.logger.info("Recorder thread stopped.")
+            # the thread's own shutdown records, logged after close_connections
+            self._stop_log_listener()
         return True
 
     # -------------------------
     # Manual stop
     # -------------------------
+    # time the sampling loop gets to wind down on its own before it is cancelled
+    MANUAL_STOP_TIMEOUT = 5.0
+
     async def manual_stop_sampling(self):
         """
         External signal to stop the current sampling loop gracefully.
         """
         if self._async_stop is not None:
             self.logger.info("Manual stop signal received.")
-            self._async_stop.set()
-            # wait for sampling task to finish
-            if self._sampling_task is not None:
-                self._sampling_task.cancel()
-                await self._sampling_task
+            self._request_stop()
+            # let the loop exit by itself (finishing the current read, draining the DB
+            # writer); shield keeps a timeout from cancelling it mid-cleanup
+            task = self._sampling_task
+            if task is not None:
+                try:
+                    await asyncio.wait_for(asyncio.shield(task), timeout=self.MANUAL_STOP_TIMEOUT)
+                except asyncio.TimeoutError:
+                    self.logger.warning("Sampling task did not stop in time, cancelling it.")
+                    task.cancel()
+                    try:
+                        await task
+                    except asyncio.CancelledError:
+                        pass
 
             self.logger.info("Sampling stopped manually.")
         else:
             self.logger.warning("Manual stop requested, but no sampling task is running.")
 
     # GRACEFUL CLOSING
-    async def close_connections(self):
+    # each close step gets CLOSE_STEP_TIMEOUT s, the whole teardown CLOSE_TOTAL_TIMEOUT s
+    CLOSE_STEP_TIMEOUT = 2.0
+    CLOSE_TOTAL_TIMEOUT = 5.0
+
+    async def _close_modbus(self) -> bool:
         try:
             if self.modbus_connection:
-                await self.modbus_connection.close()
+                await asyncio.wait_for(self.modbus_connection.close(), timeout=self.CLOSE_STEP_TIMEOUT)
                 self.modbus_initialized = False
                 self.logger.info("MODBUS connection closed.")
 
             if self.modbus_handler:
-                await self.modbus_handler.stop()
+                await asyncio.wait_for(self.modbus_handler.stop(), timeout=self.CLOSE_STEP_TIMEOUT)
                 self.modbus_initialized = False
                 self.logger.info("MODBUS HANDLER worker closed.")
 
+        except asyncio.TimeoutError:
+            self.logger.error("Timeout during stopping MODBUS handler.")
+            return False
         except Exception as e:
             self.logger.error("Error during stopping MODBUS handler.")
             self.logger.error(str(e))
             return False
+        return True
 
+    async def _close_db(self) -> bool:
         try:
             if self.db_handler:
-                await self.db_handler.stop()
+                await asyncio.wait_for(self.db_handler.stop(), timeout=self.CLOSE_STEP_TIMEOUT)
                 self.db_initialized = False
                 self.logger.info("Database connection closed.")
+        except asyncio.TimeoutError:
+            self.logger.error("Timeout during closing database connection.")
+            return False
         except Exception as e:
             self.logger.error("Error during closing database connection.")
             self.logger.error(str(e))
             return False
+        return True
+
+    async def close_connections(self):
+        # MODBUS and DB are independent: close them concurrently, bounded in time
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(self._close_modbus(), self._close_db(), return_exceptions=True),
+                timeout=self.CLOSE_TOTAL_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.logger.error(f"Closing connections did not finish within {self.CLOSE_TOTAL_TIMEOUT} s.")
+            return False
+
+        if not all(r is True for r in results):
+            return False
         
         self.instrument_initialized = False
         self.on_state_change('uninitialized')
 
+        self._stop_log_listener()
+
         return True
 
     # -------------------------
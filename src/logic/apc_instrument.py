@@ -4,7 +4,6 @@ from typing import Optional
 import logging
 
 from dataclasses import dataclass
-import asyncio
 
 from ..model.config_model import AppConfig
 from ..services.modbus_query import ModbusQuery
@@ -23,6 +22,18 @@ class PmtApcInstrument:
         ModbusQuery("pc3",30316,2,dtype="uint32"), # particle channel 2 (0.5um count @ given second ??)
     ]
 
+    TIMESTAMP = ModbusQuery("timestamp",30310,2,dtype="uint32")
+
+    # timestamp + channels are contiguous (30310..30317): read as one block
+    SAMPLE_BLOCK = (TIMESTAMP, *CHANNELS)
+    SAMPLE_BLOCK_NAMES = tuple(q.channel_name for q in SAMPLE_BLOCK)
+
+    # status / control queries, built once and shared by every call
+    SAMPLING_STATUS_QUERY = ModbusQuery("read_sampling_status",30164,1)
+    DEVICE_STATUS_QUERY = ModbusQuery("read_device_status",30214,1)
+    FLOW_QUERY = ModbusQuery("read_flow",30022,2,dtype="uint32")
+    CONTROL_SAMPLING_QUERY = ModbusQuery("control_sampling",2,1,writeable=True)
+
 
     class SamplingStatus(Enum):
         NOT_SAMPLING = 0
@@ -46,22 +57,19 @@ class PmtApcInstrument:
 
 
     async def async_read_sampling_status(self)-> "PmtApcInstrument.SamplingStatus":
-        status_query = ModbusQuery("read_sampling_status",30164,1)
-        response = await self.relay.read_input(status_query)
+        response = await self.relay.read_input(PmtApcInstrument.SAMPLING_STATUS_QUERY)
         
         return PmtApcInstrument.SamplingStatus(response)
     
 
     async def async_read_device_status(self):
-        status_query = ModbusQuery("read_sampling_status",30214,1)
-        response = await self.relay.read_input(status_query)
+        response = await self.relay.read_input(PmtApcInstrument.DEVICE_STATUS_QUERY)
 
         return PmtApcInstrument.DeviceStatus(response)
 
     async def async_read_flow(self):
         # SET flow not worked in modbus applications.
-        flow_query =  ModbusQuery("read_flow",30022,2,dtype="uint32")
-        response = await self.relay.read_input(flow_query)
+        response = await self.relay.read_input(PmtApcInstrument.FLOW_QUERY)
 
         return response
 
@@ -70,20 +78,20 @@ class PmtApcInstrument:
     async def async_start_sampling(self)-> bool:
         if self.logger:
             self.logger.debug("Starting sampling over MODBUS ....")
-            self.logger.debug(f"relay type: {type(self.relay)}, relay is None: {self.relay is None}")
+            self.logger.debug("relay type: %s, relay is None: %s", type(self.relay), self.relay is None)
 
-        control_query = ModbusQuery("control_sampling",2,1,writeable=True)
+        control_query = PmtApcInstrument.CONTROL_SAMPLING_QUERY
         
         if self.logger:
-            self.logger.debug(f"About to call write_coil with query: {control_query}")
+            self.logger.debug("About to call write_coil with query: %s", control_query)
         
         try:
             res = await self.relay.write_coil(control_query,1)
             if self.logger:
-                self.logger.debug(f"write_coil returned: {res}")
+                self.logger.debug("write_coil returned: %s", res)
         except Exception as e:
             if self.logger:
-                self.logger.error(f"Exception in write_coil: {e}")
+                self.logger.error("Exception in write_coil: %s", e)
                 self.logger.exception(e)
             return False
 
@@ -99,8 +107,7 @@ class PmtApcInstrument:
     
 
     async def async_stop_sampling(self) -> bool:
-        control_query = ModbusQuery("control_sampling",2,1,writeable=True)
-        res = await self.relay.write_coil(control_query,False)
+        res = await self.relay.write_coil(PmtApcInstrument.CONTROL_SAMPLING_QUERY,False)
         if res:
             self.sampling_status = self.SamplingStatus.NOT_SAMPLING
             return True
@@ -109,15 +116,16 @@ class PmtApcInstrument:
     # read data
 
     async def async_read_channels(self, name_list = None):
-        channels_to_read = [ModbusQuery("timestamp",30310,2,dtype="uint32")]
         if isinstance(name_list,list):
-            channels_to_read += [c for c in PmtApcInstrument.CHANNELS if c.channel_name in name_list]
+            channels_to_read = [PmtApcInstrument.TIMESTAMP] + [c for c in PmtApcInstrument.CHANNELS if c.channel_name in name_list]
+            channel_names = [c.channel_name for c in channels_to_read]
         else:
-            channels_to_read += PmtApcInstrument.CHANNELS[:]
-        
-        channel_names =[c.channel_name for c in channels_to_read]
+            # per-sample path: queries and names are prebuilt on the class
+            channels_to_read = PmtApcInstrument.SAMPLE_BLOCK
+            channel_names = PmtApcInstrument.SAMPLE_BLOCK_NAMES
 
-        values = await asyncio.gather(*[asyncio.create_task(self.relay.read_input(c)) for c in channels_to_read])
+        # one Modbus transaction for all registers instead of one per channel
+        values = await self.relay.read_input_block(channels_to_read)
      
         result = dict(zip(channel_names,values))
         return result
\ No newline at end of file
@@ -1,7 +1,11 @@
+from typing import Optional
+from dataclasses import dataclass
+import datetime
+
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy import Float
 
-from ..model.sample_model import BaseSample
+from ..model.sample_model import BaseSample, is_valid_instrument_timestamp
 
 
 
@@ -27,4 +31,57 @@ class APCSample(BaseSample):
 
     def __str__(self):
         return (f"{self.instrument_datetime}:\t"
-                f"pc1 = {self.pc1}\t|\tpc2 = {self.pc2}\t|\tpc3 = {self.pc3}")
\ No newline at end of file
+                f"pc1 = {self.pc1}\t|\tpc2 = {self.pc2}\t|\tpc3 = {self.pc3}")
+
+
+@dataclass(slots=True)
+class APCSampleRow:
+    """
+    Plain staging row for the sampling hot path: same columns as APCSample,
+    without ORM instrumentation. Persisted in batches by
+    AsyncDBHandler.add_sample_rows.
+    """
+    instrument_unix_timestamp: int
+    pc1: Optional[float]
+    pc2: Optional[float]
+    pc3: Optional[float]
+    local_datetime: Optional[datetime.datetime] = None
+    local_unix_timestamp: Optional[int] = None
+    session_id: Optional[int] = None
+
+    @staticmethod
+    def from_dict(dictionary: dict) -> "APCSampleRow":
+        return APCSampleRow(
+            dictionary.get("timestamp", 0),
+            dictionary.get("pc1"),
+            dictionary.get("pc2"),
+            dictionary.get("pc3"),
+        )
+
+    @property
+    def is_valid(self) -> bool:
+        return is_valid_instrument_timestamp(self.instrument_unix_timestamp)
+
+    def to_mapping(self, session_id: Optional[int] = None) -> dict:
+        """
+        Column -> value dict for a bulk insert; unset local times default to
+        now, and `session_id` (if given) overrides the row's own.
+        """
+        local_datetime = self.local_datetime
+        if local_datetime is None:
+            local_datetime = datetime.datetime.now(datetime.timezone.utc)
+        local_unix_timestamp = self.local_unix_timestamp
+        if local_unix_timestamp is None:
+            local_unix_timestamp = int(local_datetime.timestamp())
+        return {
+            "session_id": self.session_id if session_id is None else session_id,
+            "local_datetime": local_datetime,
+            "local_unix_timestamp": local_unix_timestamp,
+            "instrument_unix_timestamp": self.instrument_unix_timestamp,
+            "pc1": self.pc1,
+            "pc2": self.pc2,
+            "pc3": self.pc3,
+        }
+
+    def __getitem__(self, key):
+        return getattr(self, key)
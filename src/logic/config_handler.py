@@ -1,9 +1,10 @@
 from __future__ import annotations
 from typing import Union, Optional, Dict
 from pathlib import Path
-import json
 import logging
 
+from pydantic_core import from_json
+
 from ..model.config_model import AppConfig
 
 
@@ -18,6 +19,14 @@ class AppConfigHandler:
         self.config: Optional[AppConfig] = None
         self.logger: Optional[logging.Logger] = logger
 
+        # JSON text last written to / read from disk; a save with identical
+        # content is skipped (keyed on content, so direct edits of
+        # self.config are never missed)
+        self._persisted_json: Optional[str] = None
+        # (config object, its revision, dumped text); the revision is bumped
+        # on every field assignment, so direct edits invalidate it too
+        self._cached_json: Optional[tuple[AppConfig, int, str]] = None
+
     # --- Core operations ---
 
     def load_from_json(self) -> AppConfig:
@@ -29,8 +38,10 @@ class AppConfigHandler:
             else:
                 raise FileNotFoundError(f"Config file not found: {self.config_path}")
         else:
-            with self.config_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            # pydantic's own (Rust) JSON parser; no extra dependency
+            raw = self.config_path.read_bytes()
+            data = from_json(raw)
+            self._persisted_json = raw.decode("utf-8")
             merged = {**AppConfig.DEFAULTS, **data}
             self.config = AppConfig.model_validate(merged)
 
@@ -42,8 +53,12 @@ class AppConfigHandler:
         """Save current configuration to disk."""
         if self.config is None:
             raise ValueError("No configuration loaded to save.")
+        text = self.to_json()
+        if text == self._persisted_json:
+            return  # this content is already on disk
         with self.config_path.open("w", encoding="utf-8") as f:
-            f.write(self.to_json())
+            f.write(text)
+        self._persisted_json = text
 
     # --- Helpers ---
 
@@ -58,14 +73,22 @@ class AppConfigHandler:
         """Update configuration with given dictionary."""
         if self.config is None:
             raise ValueError("Config not loaded yet.")
-        updated = self.config.model_copy(update=updates)
-        self.config = AppConfig.model_validate(updated.model_dump())
+        # validate_assignment checks only the assigned fields; the copy keeps the update all-or-nothing
+        updated = self.config.model_copy()
+        for key, value in updates.items():
+            if key in AppConfig.model_fields:
+                setattr(updated, key, value)
+        self.config = updated
 
     def to_json(self) -> str:
         """Return the current config as a JSON string."""
         if self.config is None:
             raise ValueError("Config not loaded yet.")
-        return self.config.model_dump_json(indent=4)
+        cached = self._cached_json
+        if cached is None or cached[0] is not self.config or cached[1] != self.config._revision:
+            cached = (self.config, self.config._revision, self.config.model_dump_json(indent=4))
+            self._cached_json = cached
+        return cached[2]
 
     def initialize_if_missing(self) -> AppConfig:
         """Ensure config exists and has all required fields."""
@@ -75,8 +98,14 @@ class AppConfigHandler:
             return self.config
 
         updated_fields = {}
+        fields_set = self.config.model_fields_set
         for key, default in AppConfig.DEFAULTS.items():
-            if getattr(self.config, key, None) in (None, "", 0):
+            if default is None:
+                continue  # optional field, None is a valid value
+            value = getattr(self.config, key, None)
+            # 0 / False are real values (`False in (..., 0)` is True), so only
+            # absent, None or empty fields count as missing
+            if key not in fields_set or value is None or value == "":
                 updated_fields[key] = default
 
         if updated_fields:
@@ -61,27 +61,33 @@ async def async_test(sample_rate_hz: float = 1.0, print_last=False):
     await db_handler.create_session()
     await db_handler.start_session()
 
+    # status + flow + sample block in one handler job (coalesced into as few PDUs as possible)
+    queries = [PmtApcInstrument.SAMPLING_STATUS_QUERY, PmtApcInstrument.FLOW_QUERY, *PmtApcInstrument.SAMPLE_BLOCK]
+    names = PmtApcInstrument.SAMPLE_BLOCK_NAMES
+
+    loop = asyncio.get_running_loop()
     interval = 1.0 / sample_rate_hz
-    next_time = time.monotonic()
+    start_time = loop.time()
 
     for i in range(30):
-        print("T:", time.monotonic())
+        # deadline fixed before the reads, so read time is taken out of the sleep budget
+        next_time = start_time + (i + 1) * interval
+        print("T:", loop.time())
 
-        status = await instrument.async_read_sampling_status()
-        flow = await instrument.async_read_flow()
-        channels = await instrument.async_read_channels()
+        status, flow, *values = await handler.read_input_block(queries)
+        channels = dict(zip(names, values))
 
-        print("Status:", status)
+        print("Status:", PmtApcInstrument.SamplingStatus(status))
         print("Flow:", flow)
 
         await db_handler.add_sample(APCSample.from_dict(channels))
 
-        # drift-less wait
-        next_time += interval
-        sleep_time = next_time - time.monotonic()
-
+        # drift-less wait: absolute deadline on the loop clock
+        sleep_time = next_time - loop.time()
         if sleep_time > 0:
-            await asyncio.sleep(sleep_time)
+            wakeup = loop.create_future()
+            loop.call_at(next_time, wakeup.set_result, None)
+            await wakeup
         else:
             print(f"WARNING: sampling drift ({sleep_time:.3f}s behind)")
 
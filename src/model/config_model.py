@@ -1,12 +1,14 @@
 from typing import Dict, Optional, Union, ClassVar
 from ipaddress import ip_address
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from ipaddress import IPv4Address
 from pydantic import model_validator
 from pathlib import Path
 import json
 
 class AppConfig(BaseModel):
+    model_config = ConfigDict(validate_assignment=True)
+
     DEFAULTS: ClassVar[Dict] = {
         "ip": "10.10.7.60",
         "port": 1502,
@@ -22,6 +24,8 @@ class AppConfig(BaseModel):
 
         "flow": 28300.0,
 
+        "sampling_cpu": None,
+
         # "derived_metrics": False,
         # "log_enabled": True,
 
@@ -43,10 +47,20 @@ class AppConfig(BaseModel):
     
     flow: float = Field(28300.0, description="Flow rate in ml/min.")
 
+    sampling_cpu: Optional[int] = Field(None, ge=0, description="CPU core the recorder thread is pinned to (None: no pinning).")
+
     # derived_metrics: bool = False
     # log_enabled: bool = True
     allow_missing_path: bool = True
 
+    # bumped on every field assignment, so holders can cache derived data
+    _revision: int = PrivateAttr(default=0)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._revision += 1
+
     @model_validator(mode="after")
     def check_path_exists(self):
         """Ensure the path exists unless allow_missing_path is True."""
@@ -6,6 +6,11 @@ import datetime
 
 from .database_model import Base
 
+
+def is_valid_instrument_timestamp(instrument_unix_timestamp) -> bool:
+    """A sample is valid if the instrument clock is within a day of ours."""
+    return abs(datetime.datetime.now(datetime.timezone.utc).timestamp() - instrument_unix_timestamp) < (24*3600.0)
+
 class BaseSample(Base, AsyncAttrs):
     __abstract__ = True  # Absztrakt osztály, nem hoz létre saját táblát
 
@@ -32,4 +37,4 @@ class BaseSample(Base, AsyncAttrs):
     @property
     def is_valid(self)->bool:
         print()
-        return abs(datetime.datetime.now(datetime.timezone.utc).timestamp() - self.instrument_unix_timestamp) < (24*3600.0)
\ No newline at end of file
+        return is_valid_instrument_timestamp(self.instrument_unix_timestamp)
\ No newline at end of file
@@ -6,7 +6,7 @@ from typing import Type, Generic, TypeVar, Callable, Tuple, Coroutine, Any
 import threading
 import asyncio
 
-from sqlalchemy import select, inspect
+from sqlalchemy import select, inspect, insert
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine, AsyncSession, AsyncConnection
 from sqlalchemy.pool import StaticPool, NullPool
@@ -398,6 +398,39 @@ class AsyncDBHandler(Generic[T]):
 
         return success
 
+    async def add_sample_rows(self, rows:List[Any], session_id:int)->bool:
+        """
+        Persist a batch of plain staging rows (objects with `is_valid` and
+        `to_mapping(session_id)`) with one bulk INSERT into the sample table:
+        no ORM instances, one transaction, one queued job. The rows
+        themselves are not modified.
+        """
+        if session_id is None:
+            session_id = self.session_id
+
+        valid = [row for row in rows if row.is_valid]
+        if len(valid) != len(rows):
+            self._logger.info(f"{len(rows) - len(valid)} invalid sample(s) dropped @{datetime.datetime.now(datetime.timezone.utc)}")
+        if not valid:
+            return False
+
+        mappings = [row.to_mapping(session_id) for row in valid]
+
+        async def _add_sample_rows_impl(mappings:List[dict])->bool:
+            async with self._lock:
+                async with self._session_factory() as session:
+                    assert isinstance(session,AsyncSession)
+                    await session.execute(insert(self._sample_model), mappings)
+                    await session.commit()
+                    return True
+            return False
+
+        success = await self._submit_job(_add_sample_rows_impl,mappings)
+        if success:
+            self._samples_written+=len(valid)
+
+        return success
+
     async def get_all_samples(self)->List[T]:
         async def _get_all_samples_impl()->List[T]:
             async with self._lock:
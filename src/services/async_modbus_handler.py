@@ -39,6 +39,11 @@ class AsyncModbusHandler:
     >>> await handler.stop()
     """
 
+    # register block coalescing: queries closer than MAX_GAP words share one
+    # request, a request never spans more than MAX_BLOCK words (Modbus limit)
+    MAX_GAP = 4
+    MAX_BLOCK = 125
+
     def __init__(
         self,
         connection: AsyncModbusConnection,
@@ -376,6 +381,78 @@ class AsyncModbusHandler:
 
         return query.parse_value_from_registers(result.registers)
 
+    async def read_input_block(self, queries: List[ModbusQuery]) -> List[Any]:
+        """
+        Read several input-register queries with as few Modbus requests as possible.
+
+        Queries are grouped into runs of nearby registers (see `_coalesce`);
+        each run is one contiguous read and each value is parsed from its
+        own slice. Adjacent queries, like the APC sample block, need one
+        request.
+
+        Returns
+        -------
+        List[Any]
+            Parsed values, in the order of `queries`.
+        """
+        return await self._submit_job(self._read_input_block_impl, queries)
+
+    @classmethod
+    def _coalesce(cls, queries: List[ModbusQuery]) -> List[Tuple[int, int, List[Tuple[int, ModbusQuery]]]]:
+        """
+        Group queries into contiguous read runs.
+
+        Returns
+        -------
+        List[Tuple[int, int, List[Tuple[int, ModbusQuery]]]]
+            (start register, word count, [(index in `queries`, query)]) per run.
+        """
+        order = sorted(range(len(queries)), key=lambda i: queries[i].register)
+        runs = []
+        for i in order:
+            q = queries[i]
+            q_end = q.register + q.length
+            if runs:
+                start, end, members = runs[-1]
+                if q.register - end <= cls.MAX_GAP and max(end, q_end) - start <= cls.MAX_BLOCK:
+                    runs[-1] = (start, max(end, q_end), members)
+                    members.append((i, q))
+                    continue
+            runs.append((q.register, q_end, [(i, q)]))
+        return [(start, end - start, members) for start, end, members in runs]
+
+    async def _read_input_block_impl(self, queries: List[ModbusQuery]) -> List[Any]:
+        """
+        Worker implementation for the coalesced input register read.
+
+        Raises
+        ------
+        ModbusException
+            If client unavailable or read operation fails.
+        """
+        client = await self._get_client()
+        if client is None:
+            raise ModbusException(
+                f"Failed to get client for read_input_block ({len(queries)} queries)"
+            )
+
+        values: List[Any] = [None] * len(queries)
+        for start, count, members in self._coalesce(queries):
+            result = await client.read_input_registers(
+                address=start,
+                count=count
+            )
+            if result.isError():
+                raise ModbusException(
+                    f"Error reading input registers {start}-{start + count - 1}: {result}"
+                )
+
+            registers = result.registers
+            for i, q in members:
+                offset = q.register - start
+                values[i] = q.parse_value_from_registers(registers[offset:offset + q.length])
+        return values
+
     async def read_holding(self, query: ModbusQuery) -> Any:
         """
         Read Modbus holding registers.
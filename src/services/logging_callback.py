@@ -52,7 +52,9 @@ class CallbackLoggingHandler(QtCore.QObject, logging.Handler):
         for cb in self._record_callbacks:
             cb(record)
 
-        # legacy string callbacks
+        # legacy string callbacks (only format when someone listens)
+        if not self._string_callbacks:
+            return
         msg = self.format(record)
         for cb in self._string_callbacks:
             cb(msg)
@@ -1,7 +1,9 @@
 import logging
 from pathlib import Path
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from collections import deque
+from typing import Optional
 
 from PySide6 import QtCore
 from PySide6.QtWidgets import QAbstractItemView, QTableView
@@ -18,6 +20,11 @@ class LogRow:
     level: str
     source: str
     message: str
+    # lowercased once at creation, used by LogFilterProxy
+    message_lower: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.message_lower = self.message.lower()
 
 
 class LogTableModel(QtCore.QAbstractTableModel):
@@ -43,6 +50,9 @@ class LogTableModel(QtCore.QAbstractTableModel):
         if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
             return self.HEADERS[section]
 
+    def row_at(self, row: int) -> LogRow:
+        return self._rows[row]
+
     # --------------------------------------------------
     # DATA + ROLES
     # --------------------------------------------------
@@ -106,13 +116,53 @@ class LogTableModel(QtCore.QAbstractTableModel):
 
         self.endInsertRows()
 
+    def append_batch(self, records: list[LogRow]):
+        """
+        Append several rows with a single insert notification.
+        """
+        if not records:
+            return
+
+        first = len(self._rows)
+        self.beginInsertRows(
+            QtCore.QModelIndex(),
+            first,
+            first + len(records) - 1
+        )
+        self._rows.extend(records)
+        self.endInsertRows()
+
+        overflow = len(self._rows) - self._max_rows
+        if overflow > 0:
+            self.beginRemoveRows(QtCore.QModelIndex(), 0, overflow - 1)
+            del self._rows[:overflow]
+            self.endRemoveRows()
+
 
 class QtLogTableBridge(QtCore.QObject):
-    log_received = QtCore.Signal(object)
+    """
+    Collects log records from any thread and flushes them into the
+    model in batches from a GUI-thread timer.
+    """
+
+    # emitted once after each non-empty flush
+    flushed = QtCore.Signal()
 
-    def __init__(self, model: LogTableModel):
+    def __init__(self, model: LogTableModel,
+                 proxy: Optional[QtCore.QSortFilterProxyModel] = None,
+                 interval_ms: int = 50, max_batch: int = 500):
         super().__init__()
-        self.log_received.connect(model.append)
+        self._model = model
+        self._proxy = proxy
+        self._max_batch = max_batch
+
+        # deque.append / popleft are atomic, no lock needed
+        self._pending: deque[LogRow] = deque()
+
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setInterval(interval_ms)
+        self._flush_timer.timeout.connect(self._flush_logs)
+        self._flush_timer.start()
 
     def handle_record(self, record: logging.LogRecord):
         row = LogRow(
@@ -121,7 +171,26 @@ class QtLogTableBridge(QtCore.QObject):
             source=record.name,
             message=record.getMessage()
         )
-        self.log_received.emit(row)
+        self._pending.append(row)
+
+    @QtCore.Slot()
+    def _flush_logs(self):
+        if not self._pending:
+            return
+
+        batch = []
+        while self._pending and len(batch) < self._max_batch:
+            batch.append(self._pending.popleft())
+
+        # let the proxy re-sort once per batch instead of tracking each change
+        if self._proxy is not None and self._proxy.dynamicSortFilter():
+            self._proxy.setDynamicSortFilter(False)
+            self._model.append_batch(batch)
+            self._proxy.setDynamicSortFilter(True)
+        else:
+            self._model.append_batch(batch)
+
+        self.flushed.emit()
 
 
 class LogFilterProxy(QtCore.QSortFilterProxyModel):
@@ -139,15 +208,13 @@ class LogFilterProxy(QtCore.QSortFilterProxyModel):
         self.invalidateFilter()
 
     def filterAcceptsRow(self, row, parent):
-        model = self.sourceModel()
-
-        msg = model.index(row, 3).data()
-        level = model.index(row, 1).data()
+        # read the LogRow directly: no index()/data() round trip per cell
+        log_row = self.sourceModel().row_at(row)
 
-        if self.level_filter != "ALL" and level != self.level_filter:
+        if self.level_filter != "ALL" and log_row.level != self.level_filter:
             return False
 
-        if self.text_filter and self.text_filter not in msg.lower():
+        if self.text_filter and self.text_filter not in log_row.message_lower:
             return False
 
         return True
@@ -156,11 +223,13 @@ class LogFilterProxy(QtCore.QSortFilterProxyModel):
 def enable_autoscroll(
     tableview: QtCore.QObject,
     model: QtCore.QAbstractItemModel,
-    checkbox: QtCore.QObject
+    checkbox: QtCore.QObject,
+    bridge: Optional[QtLogTableBridge] = None
 ):
     """
     Scroll tableview to bottom when new rows are inserted
     if checkbox is checked.
+    With a bridge, scroll once per batched flush instead of per insert.
     """
 
     def _auto_scroll(*_):
@@ -171,7 +240,10 @@ def enable_autoscroll(
     lambda state: tableview.scrollToBottom() if state else None
     )
 
-    model.rowsInserted.connect(_auto_scroll)
+    if bridge is not None:
+        bridge.flushed.connect(_auto_scroll)
+    else:
+        model.rowsInserted.connect(_auto_scroll)
 
 
 def enable_sorting(tableview, proxy_model):